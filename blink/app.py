@@ -15,7 +15,9 @@ from blink.camera.camera_manager import CameraManager
 from blink.config.config_manager import ConfigManager
 from blink.config.settings import Settings
 from blink.core.aggregated_store import AggregatedStatsStore
+from blink.core.statistics import BlinkStats
 from blink.core.time_trigger import TimeTriggerEngine
+from blink.threading.preview_converter import PreviewConverter
 from blink.threading.signal_bus import SignalBus
 from blink.threading.vision_worker import VisionWorker
 from blink.ui.main_window import MainWindow
@@ -25,7 +27,7 @@ from blink.utils.logger import setup_logging
 from blink.utils.platform import get_app_paths
 from loguru import logger
 from PyQt6.QtWidgets import QApplication, QSystemTrayIcon
-from PyQt6.QtCore import QThread, Qt, QTimer
+from PyQt6.QtCore import QThread, Qt
 
 
 class BlinkApplication(QApplication):
@@ -50,6 +52,7 @@ class BlinkApplication(QApplication):
         self._init_camera()
         self._init_vision_worker_thread()
         self._init_ui()
+        self._init_preview_thread()
 
         logger.info("Blink! application initialized")
 
@@ -141,21 +144,27 @@ class BlinkApplication(QApplication):
         )
         self.vision_worker.moveToThread(self.vision_thread)
 
-        # Connect vision worker signals (queued across threads automatically)
-        self.vision_worker.blink_detected.connect(self._on_blink_detected)
-        self.vision_worker.statistics_updated.connect(self._on_statistics_updated)
-        self.vision_worker.face_detected.connect(self._on_face_detected)
-        self.vision_worker.camera_status_changed.connect(self._on_camera_status_changed)
-        self.vision_worker.calibration_progress.connect(self._on_calibration_progress)
-        self.vision_worker.calibration_complete.connect(self._on_calibration_complete)
-        self.vision_worker.error_occurred.connect(self._on_error)
-        self.vision_worker.frame_preview.connect(self._on_frame_preview)
+        # Connect vision worker signals; explicitly queued so every handler runs on the
+        # GUI thread, where the window's coalescing timers merge bursts into one render
+        queued = Qt.ConnectionType.QueuedConnection
+        self.vision_worker.blink_detected.connect(self._on_blink_detected, queued)
+        self.vision_worker.statistics_updated.connect(self._on_statistics_updated, queued)
+        self.vision_worker.face_detected.connect(self._on_face_detected, queued)
+        self.vision_worker.camera_status_changed.connect(self._on_camera_status_changed, queued)
+        self.vision_worker.calibration_progress.connect(self._on_calibration_progress, queued)
+        self.vision_worker.calibration_complete.connect(self._on_calibration_complete, queued)
+        self.vision_worker.calibration_failed.connect(self._on_calibration_failed, queued)
+        self.vision_worker.error_occurred.connect(self._on_error, queued)
+        self.vision_worker.frame_preview.connect(self._on_frame_preview, queued)
 
         # Connect signal bus to vision worker
         self.signal_bus.start_monitoring.connect(self.vision_worker.start_monitoring, Qt.ConnectionType.QueuedConnection)
         self.signal_bus.stop_monitoring.connect(self.vision_worker.stop_monitoring, Qt.ConnectionType.QueuedConnection)
         self.signal_bus.start_preview.connect(self.vision_worker.start_preview, Qt.ConnectionType.QueuedConnection)
         self.signal_bus.stop_preview.connect(self.vision_worker.stop_preview, Qt.ConnectionType.QueuedConnection)
+        self.signal_bus.start_calibration.connect(
+            self.vision_worker.start_calibration, Qt.ConnectionType.QueuedConnection
+        )
         self.signal_bus.camera_enabled_changed.connect(
             self.vision_worker.set_camera_enabled, Qt.ConnectionType.QueuedConnection
         )
@@ -214,6 +223,25 @@ class BlinkApplication(QApplication):
             logger.exception("UI initialization failed")
             raise
 
+    def _init_preview_thread(self) -> None:
+        """Run preview resampling on its own thread so the UI only uploads pixmaps."""
+        self.preview_thread = QThread(self)
+        self.preview_thread.setObjectName("PreviewThread")
+
+        self.preview_converter = PreviewConverter()
+        self.preview_converter.moveToThread(self.preview_thread)
+
+        # Direct: submit() only swaps the mailbox slot and wakes the converter thread
+        self.main_window.preview_requested.connect(
+            self.preview_converter.submit, Qt.ConnectionType.DirectConnection
+        )
+        self.preview_converter.image_ready.connect(
+            self.main_window.set_preview_image, Qt.ConnectionType.QueuedConnection
+        )
+        self.preview_thread.start()
+
+        logger.info("Preview converter thread started")
+
     def _on_blink_detected(self) -> None:
         """Handle blink detected signal.
 
@@ -222,11 +250,11 @@ class BlinkApplication(QApplication):
         logger.debug("Blink detected")
         self.signal_bus.blink_detected.emit()
 
-    def _on_statistics_updated(self, stats: dict) -> None:
+    def _on_statistics_updated(self, stats: BlinkStats) -> None:
         """Handle statistics update signal.
 
         Args:
-            stats: Statistics dictionary from vision worker.
+            stats: Statistics snapshot from vision worker.
         """
         self.main_window.update_statistics(stats)
         self.signal_bus.statistics_updated.emit(stats)
@@ -249,8 +277,17 @@ class BlinkApplication(QApplication):
         self.main_window.set_camera_status(active)
         self.signal_bus.camera_status_changed.emit(active)
 
-    def _on_frame_preview(self, frame) -> None:
-        """Send preview frame to UI."""
+    def _on_frame_preview(self, frame_id: int, frame) -> None:
+        """Send preview frame to UI, skipping it if a newer one is already queued.
+
+        Frames queued behind a busy GUI thread are dropped so only the latest is drawn.
+
+        Args:
+            frame_id: Producer-assigned preview frame id.
+            frame: Small BGR frame, or None to clear the preview.
+        """
+        if frame_id < self.vision_worker.latest_preview_id:
+            return
         self.main_window.show_preview(frame)
 
     def _on_calibration_progress(self, progress: int) -> None:
@@ -276,6 +313,14 @@ class BlinkApplication(QApplication):
 
         logger.info(f"Calibration complete, threshold saved: {threshold:.3f}")
 
+    def _on_calibration_failed(self, reason: str) -> None:
+        """Handle calibration failed signal.
+
+        Args:
+            reason: Why calibration ended without a threshold.
+        """
+        self.main_window.on_calibration_failed(reason)
+
     def _on_error(self, error_message: str) -> None:
         """Handle error signal.
 
@@ -363,6 +408,11 @@ class BlinkApplication(QApplication):
             self.vision_thread.quit()
             self.vision_thread.wait(2000)
 
+        # Stop preview converter thread
+        if hasattr(self, "preview_thread"):
+            self.preview_thread.quit()
+            self.preview_thread.wait(2000)
+
         # Final camera close (idempotent)
         self.camera_manager.close_camera()
 
@@ -1,7 +1,6 @@
 """Camera capture and management."""
 
 import platform
-from collections import deque
 from typing import Optional, Tuple, List
 
 import cv2
@@ -241,7 +240,6 @@ class CameraManager(QObject):
 
         try:
             import ctypes
-            from ctypes import wintypes
 
             ole32 = ctypes.OleDLL("ole32")
             ole32.CoInitialize(None)
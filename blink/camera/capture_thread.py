@@ -5,9 +5,6 @@ from time import time, sleep
 from loguru import logger
 from PyQt6.QtCore import QThread, pyqtSignal
 
-import cv2
-import numpy as np
-
 from blink.camera.camera_manager import CameraManager
 
 
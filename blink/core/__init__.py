@@ -2,6 +2,6 @@
 
 from blink.core.alert_engine import AlertEngine
 from blink.core.blink_monitor import BlinkMonitor
-from blink.core.statistics import BlinkStatistics
+from blink.core.statistics import BlinkStatistics, BlinkStats
 
-__all__ = ["AlertEngine", "BlinkMonitor", "BlinkStatistics"]
+__all__ = ["AlertEngine", "BlinkMonitor", "BlinkStatistics", "BlinkStats"]
@@ -1,6 +1,6 @@
 """Alert engine for triggering animations."""
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional
 
 from blink.config.settings import Settings
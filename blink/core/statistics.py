@@ -3,11 +3,22 @@
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Deque
+from typing import Deque, NamedTuple
 
 from loguru import logger
 
 
+class BlinkStats(NamedTuple):
+    """Per-second statistics snapshot emitted by the vision worker."""
+
+    current_ear: float
+    blinks_per_minute: float
+    blinks_last_minute: int
+    time_since_last_blink_seconds: float
+    total_blinks: int = 0
+    consecutive_open_seconds: float = 0.0
+
+
 @dataclass
 class BlinkStatistics:
     """Tracks blink statistics over time."""
@@ -11,6 +11,7 @@ from PyQt6.QtCore import QObject
 
 from blink.config.settings import Settings, TriggerLogic
 from blink.core.aggregated_store import AggregatedStatsStore
+from blink.core.statistics import BlinkStats
 from blink.threading.signal_bus import SignalBus
 
 
@@ -89,7 +90,7 @@ class TimeTriggerEngine(QObject):
         if self._stats_store:
             self._stats_store.record_blink(now)
 
-    def evaluate_statistics(self, stats: dict) -> None:
+    def evaluate_statistics(self, stats: BlinkStats) -> None:
         """Evaluate trigger rules using latest statistics."""
         if self.is_paused:
             return
@@ -115,12 +116,12 @@ class TimeTriggerEngine(QObject):
         self._signal_bus.animation_requested.emit(self.settings.alert_mode)
 
     # ----------------- Logic helpers -----------------
-    def _should_trigger(self, stats: dict, now: datetime) -> tuple[bool, str]:
+    def _should_trigger(self, stats: BlinkStats, now: datetime) -> tuple[bool, str]:
         """Decide if trigger conditions are met."""
         mode = TriggerLogic(self.settings.trigger_logic)
 
-        no_blink_seconds = stats.get("time_since_last_blink_seconds", 0.0)
-        low_rate_bpm = stats.get("blinks_per_minute", 0.0)
+        no_blink_seconds = stats.time_since_last_blink_seconds
+        low_rate_bpm = stats.blinks_per_minute
 
         no_blink_condition = no_blink_seconds >= self.settings.no_blink_seconds
         low_rate_condition = self._is_low_rate(now)
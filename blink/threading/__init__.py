@@ -1,6 +1,7 @@
 """Threading utilities for Blink!."""
 
+from blink.threading.preview_converter import PreviewConverter
 from blink.threading.signal_bus import SignalBus
 from blink.threading.vision_worker import VisionWorker
 
-__all__ = ["SignalBus", "VisionWorker"]
+__all__ = ["PreviewConverter", "SignalBus", "VisionWorker"]
@@ -0,0 +1,106 @@
+"""Off-UI-thread preparation of camera preview images."""
+
+import cv2
+import numpy as np
+from loguru import logger
+from PyQt6.QtCore import QMutex, QObject, Qt, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QImage
+
+
+class PreviewConverter(QObject):
+    """Resample BGR frames to preview size and wrap them as QImages.
+
+    Lives on its own QThread so the GUI thread only uploads the finished
+    image to a pixmap. Frames arrive through a single-slot mailbox: if the
+    converter falls behind, older frames are overwritten instead of queued.
+    """
+
+    image_ready = pyqtSignal(object)  # Emits display-sized QImage
+    _drain_requested = pyqtSignal()
+
+    def __init__(self, width: int = 480, height: int = 270):
+        """Initialize preview converter.
+
+        Args:
+            width: Preview box width in pixels.
+            height: Preview box height in pixels.
+        """
+        super().__init__()
+        self.width = width
+        self.height = height
+        # Source (h, w) -> target (tw, th); the camera shape rarely changes
+        self._size_cache: tuple[tuple[int, int], tuple[int, int]] | None = None
+        self._mutex = QMutex()
+        self._latest: np.ndarray | None = None
+        # Explicitly queued: submit() runs on the caller's thread, _drain on ours
+        self._drain_requested.connect(self._drain, Qt.ConnectionType.QueuedConnection)
+
+    def submit(self, frame: np.ndarray) -> None:
+        """Post a frame for conversion, replacing any frame not yet picked up.
+
+        Safe to call from any thread; only the newest frame is ever converted.
+
+        Args:
+            frame: BGR camera frame.
+        """
+        self._mutex.lock()
+        try:
+            idle = self._latest is None
+            self._latest = frame
+        finally:
+            self._mutex.unlock()
+        if idle:
+            self._drain_requested.emit()
+
+    @pyqtSlot()
+    def _drain(self) -> None:
+        """Take the newest posted frame and convert it."""
+        self._mutex.lock()
+        try:
+            frame, self._latest = self._latest, None
+        finally:
+            self._mutex.unlock()
+        if frame is not None:
+            self.convert(frame)
+
+    def _target_size(self, h: int, w: int) -> tuple[int, int]:
+        """Return the preview size for a source shape, recomputing only on change.
+
+        Args:
+            h: Source frame height.
+            w: Source frame width.
+
+        Returns:
+            Target (width, height) preserving the source aspect ratio.
+        """
+        if self._size_cache is None or self._size_cache[0] != (h, w):
+            scale = min(self.width / w, self.height / h)
+            target = (max(1, int(w * scale)), max(1, int(h * scale)))
+            self._size_cache = ((h, w), target)
+        return self._size_cache[1]
+
+    @pyqtSlot(object)
+    def convert(self, frame: np.ndarray) -> None:
+        """Fit a frame inside the preview box and emit it as a QImage.
+
+        Args:
+            frame: BGR camera frame.
+        """
+        try:
+            tw, th = self._target_size(frame.shape[0], frame.shape[1])
+            image = QImage(tw, th, QImage.Format.Format_BGR888)
+            ptr = image.bits()
+            ptr.setsize(image.sizeInBytes())
+            # QImage pads rows to 4 bytes; a strided view over its own buffer lets the
+            # resize fill the padded layout directly, so QPixmap upload needs no realign
+            dst = np.ndarray(
+                (th, tw, 3), dtype=np.uint8, buffer=ptr, strides=(image.bytesPerLine(), 3, 1)
+            )
+            resized = cv2.resize(frame, (tw, th), dst=dst, interpolation=cv2.INTER_LINEAR)
+            if resized is not dst:
+                # OpenCV may reject a non-contiguous dst and allocate its own output;
+                # copy it in so the image never ships blank or stale
+                dst[...] = resized
+            self.image_ready.emit(image)
+        except Exception as exc:
+            logger.debug(f"Preview conversion failed: {exc}")
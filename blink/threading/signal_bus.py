@@ -8,7 +8,7 @@ class SignalBus(QObject):
 
     # Vision signals
     blink_detected = pyqtSignal()
-    statistics_updated = pyqtSignal(dict)
+    statistics_updated = pyqtSignal(object)  # BlinkStats
     face_detected = pyqtSignal(bool)
     camera_status_changed = pyqtSignal(bool)
 
@@ -22,6 +22,7 @@ class SignalBus(QObject):
     stop_monitoring = pyqtSignal()
     start_preview = pyqtSignal()
     stop_preview = pyqtSignal()
+    start_calibration = pyqtSignal()
     camera_enabled_changed = pyqtSignal(bool)
     settings_changed = pyqtSignal(object)
     pause_for_duration = pyqtSignal(int)
@@ -1,7 +1,6 @@
 """Vision processing worker thread with real MediaPipe detection."""
 
-from datetime import datetime
-from time import time, sleep
+from time import time
 from typing import Optional
 
 import cv2
@@ -10,11 +9,15 @@ import numpy as np
 from blink.camera.camera_manager import CameraManager
 from blink.camera.capture_thread import CaptureThread
 from blink.camera.frame_queue import FrameQueue
+from blink.core.statistics import BlinkStats
 from blink.vision.blink_detector import BlinkDetector, BlinkMetrics
-from blink.vision.eye_analyzer import EyeAnalyzer, EyeMetrics
+from blink.vision.eye_analyzer import EyeAnalyzer
 from blink.vision.face_detector import FaceDetector
 from loguru import logger
-from PyQt6.QtCore import QObject, QThread, QMutex, QTimer, pyqtSignal
+from PyQt6.QtCore import QObject, QMutex, pyqtSignal
+
+# Preview box (width, height) shown by the main window
+_PREVIEW_SIZE = (480, 270)
 
 
 class VisionWorker(QObject):
@@ -22,12 +25,13 @@ class VisionWorker(QObject):
 
     # Status signals
     blink_detected = pyqtSignal()
-    statistics_updated = pyqtSignal(dict)
+    statistics_updated = pyqtSignal(object)  # Emits BlinkStats
     face_detected = pyqtSignal(bool)
     camera_status_changed = pyqtSignal(bool)
-    frame_preview = pyqtSignal(object)  # Emits small BGR frame for UI preview
+    frame_preview = pyqtSignal(int, object)  # Emits (frame id, small BGR frame) for UI preview
     calibration_progress = pyqtSignal(int)  # Emits percentage
     calibration_complete = pyqtSignal(float)
+    calibration_failed = pyqtSignal(str)  # Emits reason calibration ended without a threshold
 
     # Error signals
     error_occurred = pyqtSignal(str)
@@ -73,13 +77,22 @@ class VisionWorker(QObject):
         # Calibration data
         self._calibration_samples: list[float] = []
         self._calibration_duration = 5  # seconds
+        # Give up when not enough face frames arrive (e.g. no face in view)
+        self._calibration_timeout = 3 * self._calibration_duration
+        self._calibration_deadline = 0.0
 
         # Current metrics
         self._current_ear = 0.0
         self._last_face_detected = False
         self._last_stats_time = time()
+        self._last_stats: Optional[BlinkStats] = None
         self._binks_in_last_minute = 0
         self._preview_skip = 0
+        # Monotonic id stamped on each preview emit so the UI can drop stale frames
+        self._preview_seq = 0
+        # Guards _preview_seq alone; the GUI thread reads it per preview, so it must
+        # never wait behind the main mutex held across camera open/close
+        self._preview_mutex = QMutex()
         self._max_camera_id_probe = 3
         self._preview_only = False
         self._pending_restart = False
@@ -189,6 +202,7 @@ class VisionWorker(QObject):
 
             self._running = True
             self._calibrating = False
+            self._last_stats = None
             logger.info("Vision monitoring started")
 
         finally:
@@ -202,7 +216,7 @@ class VisionWorker(QObject):
                 return
 
             self._running = False
-            self._calibrating = False
+            self._cancel_calibration("Monitoring stopped")
 
             # Stop capture thread
             if self._capture_thread:
@@ -267,7 +281,7 @@ class VisionWorker(QObject):
             self._preview_only = False
             if self._capture_thread:
                 self._capture_thread.stop_capture()
-            self.frame_preview.emit(None)
+            self.frame_preview.emit(self._next_preview_id(), None)
             # Ensure camera is released when preview ends
             self.camera_manager.close_camera()
             self.camera_status_changed.emit(False)
@@ -282,6 +296,7 @@ class VisionWorker(QObject):
             self._camera_enabled_flag = enabled
             if not enabled:
                 self._running = False
+                self._cancel_calibration("Camera disabled")
                 self._preview_only = False
                 if self._capture_thread:
                     self._capture_thread.stop_capture()
@@ -302,16 +317,57 @@ class VisionWorker(QObject):
         try:
             if not self._running:
                 logger.warning("Cannot calibrate: monitoring not active")
+                self.calibration_failed.emit("Monitoring not active")
                 return
 
             self._calibrating = True
             self._calibration_samples = []
+            self._calibration_deadline = time() + self._calibration_timeout
             logger.info("Calibration started")
             self.calibration_progress.emit(0)
 
         finally:
             self._mutex.unlock()
 
+    def _cancel_calibration(self, reason: str) -> None:
+        """Abandon an in-progress calibration and tell the UI why.
+
+        Args:
+            reason: Short human-readable reason for the cancellation.
+        """
+        if not self._calibrating:
+            return
+        self._calibrating = False
+        self._calibration_samples = []
+        logger.info(f"Calibration cancelled: {reason}")
+        self.calibration_failed.emit(reason)
+
+    def _emit_preview(self, frame: np.ndarray) -> None:
+        """Emit a preview frame, pre-shrunk by an integer factor toward the preview box.
+
+        HD frames are area-averaged down to at most twice the preview size so the
+        UI queue never pins full-resolution buffers; the converter does the final fit.
+
+        Args:
+            frame: Full-resolution captured frame (BGR).
+        """
+        h, w = frame.shape[:2]
+        factor = min(h // _PREVIEW_SIZE[1], w // _PREVIEW_SIZE[0])
+        if factor > 1:
+            frame = cv2.resize(
+                frame, (w // factor, h // factor), interpolation=cv2.INTER_AREA
+            )
+        self.frame_preview.emit(self._next_preview_id(), frame)
+
+    def _next_preview_id(self) -> int:
+        """Advance and publish the preview id before the frame carrying it is emitted."""
+        self._preview_mutex.lock()
+        try:
+            self._preview_seq += 1
+            return self._preview_seq
+        finally:
+            self._preview_mutex.unlock()
+
     def _process_frame(self, frame: np.ndarray) -> None:
         """Process a captured frame.
 
@@ -323,7 +379,7 @@ class VisionWorker(QObject):
 
         # Preview-only path: just forward frames, no heavy processing
         if self._preview_only and not self._running:
-            self.frame_preview.emit(frame)
+            self._emit_preview(frame)
             return
 
         if not self._running:
@@ -332,7 +388,10 @@ class VisionWorker(QObject):
         # Always emit preview periodically so the user sees the camera even before detection
         self._preview_skip = (self._preview_skip + 1) % 2
         if self._preview_skip == 0:
-            self.frame_preview.emit(frame)
+            self._emit_preview(frame)
+
+        if self._calibrating and time() >= self._calibration_deadline:
+            self._cancel_calibration("No face detected")
 
         try:
             # Process frame with face detector
@@ -417,17 +476,19 @@ class VisionWorker(QObject):
         Args:
             blink_metrics: Current blink metrics.
         """
-        stats = {
-            "total_blinks": self._blink_detector.get_total_blinks(),
-            "current_ear": round(self._current_ear, 3),
-            "blinks_per_minute": round(blink_metrics.blink_rate_per_minute, 1),
-            "blinks_last_minute": blink_metrics.blinks_last_minute,
-            "time_since_last_blink_seconds": round(
-                blink_metrics.time_since_last_blink_seconds, 1
-            ),
-            "consecutive_open_seconds": round(blink_metrics.consecutive_open_seconds, 1),
-        }
+        stats = BlinkStats(
+            current_ear=round(self._current_ear, 3),
+            blinks_per_minute=round(blink_metrics.blink_rate_per_minute, 1),
+            blinks_last_minute=blink_metrics.blinks_last_minute,
+            time_since_last_blink_seconds=round(blink_metrics.time_since_last_blink_seconds, 1),
+            total_blinks=self._blink_detector.get_total_blinks(),
+            consecutive_open_seconds=round(blink_metrics.consecutive_open_seconds, 1),
+        )
 
+        # Consumers are event-driven; don't wake them for an unchanged snapshot
+        if stats == self._last_stats:
+            return
+        self._last_stats = stats
         self.statistics_updated.emit(stats)
 
     def cleanup(self) -> None:
@@ -463,6 +524,15 @@ class VisionWorker(QObject):
         """Check if calibration is in progress."""
         return self._calibrating
 
+    @property
+    def latest_preview_id(self) -> int:
+        """Id of the most recently emitted preview frame (safe from any thread)."""
+        self._preview_mutex.lock()
+        try:
+            return self._preview_seq
+        finally:
+            self._preview_mutex.unlock()
+
     @property
     def current_ear(self) -> float:
         """Get current Eye Aspect Ratio."""
@@ -1,7 +1,15 @@
 """UI components for Blink!."""
 
 from blink.ui.main_window import MainWindow
-from blink.ui.settings_dialog import SettingsDialog
 from blink.ui.tray_icon import TrayIcon
 
 __all__ = ["MainWindow", "SettingsDialog", "TrayIcon"]
+
+
+def __getattr__(name: str):
+    """Import the settings dialog only when it is first requested."""
+    if name == "SettingsDialog":
+        from blink.ui.settings_dialog import SettingsDialog
+
+        return SettingsDialog
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
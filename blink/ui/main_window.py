@@ -1,15 +1,20 @@
 """Main application window for Blink!."""
 
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 from loguru import logger
 
 from blink.config.settings import Settings
 from blink.config.config_manager import ConfigManager
+from blink.core.statistics import BlinkStats
 from blink.threading.signal_bus import SignalBus
-from blink.ui.settings_dialog import SettingsDialog
-from blink.utils.diagnostics import export_diagnostics
-from PyQt6.QtCore import Qt, QTimer, pyqtSlot
-from PyQt6.QtGui import QKeySequence, QShortcut, QImage, QPixmap
+from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QKeySequence, QShortcut, QImage, QPixmap, QStandardItem, QStandardItemModel
 from PyQt6.QtWidgets import (
+    QApplication,
     QCheckBox,
     QComboBox,
     QGridLayout,
@@ -23,10 +28,188 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+if TYPE_CHECKING:
+    from blink.ui.settings_dialog import SettingsDialog
+
+
+_MAIN_QSS = """
+QMainWindow { background: #0b1220; }
+QLabel { color: #e5e7eb; }
+QLabel#Title { font-size: 28px; font-weight: 800; color: #e8edf5; letter-spacing: 0.3px; }
+QLabel#Subtitle { color: #94a3b8; font-size: 13px; }
+QLabel#SectionTitle { color: #e5e7eb; font-size: 14px; font-weight: 700; }
+QLabel#StatLabel { color: #94a3b8; font-size: 12px; }
+QLabel#StatValue { color: #e8edf5; font-size: 26px; font-weight: 750; }
+QLabel#Chip { background: #1e293b; color: #e2e8f0; padding: 6px 12px; border-radius: 16px; font-weight: 700; }
+QLabel#Chip[state="monitoring"] { background: #14532d; color: #d1fae5; }
+QLabel#Chip[state="calibrating"] { background: #854d0e; color: #fef9c3; }
+QLabel#Helper { color: #94a3b8; font-size: 12px; }
+QLabel#Preview { color: #cbd5e1; border: 1px dashed #1f2c46; background: #0d1424; border-radius: 10px; }
+QWidget#Card { background: #111a2f; border: 1px solid #1f2c46; border-radius: 14px; }
+QPushButton { font-size: 14px; padding: 12px; border-radius: 10px; border: none; font-weight: 700; }
+QPushButton#Primary { background: #22c55e; color: #0b1220; }
+QPushButton#Primary[state="stop"] { background: #ef4444; }
+QPushButton#Accent { background: #0ea5e9; color: #0b1220; }
+QPushButton#Neutral { background: #1e293b; color: #e2e8f0; }
+QPushButton#Warning { background: #f59e0b; color: #0b1220; }
+QPushButton:disabled { background: #1f2f46; color: #7c879e; }
+QLabel#CameraStatus, QLabel#FaceStatus { font-size: 13px; font-weight: 700; }
+QLabel#CameraStatus { color: #f87171; }
+QLabel#FaceStatus { color: #e5e7eb; }
+QLabel#CameraStatus[active="true"], QLabel#FaceStatus[active="true"] { color: #22c55e; }
+QProgressBar { background: #0f172a; color: #e5e7eb; border: 1px solid #1f2c46; border-radius: 8px; text-align: center; }
+QProgressBar::chunk { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #38bdf8, stop:1 #22d3ee); border-radius: 8px; }
+"""
+
+# Seconds a camera enumeration stays fresh before re-probing devices
+_CAMERA_CACHE_TTL = 5.0
+# Quiet period before a combo change restarts capture
+_CAMERA_SELECT_DEBOUNCE_MS = 300
+# Worker status signals already queued when the first arrives are merged into one
+# label pass on the next event-loop turn
+_STATUS_COALESCE_MS = 0
+# Refresh cadence of the locally derived "since last blink" label
+_SINCE_TICK_MS = 200
+# The worker reports calibration progress per frame; the bar repaints at most ~30 Hz
+_PROGRESS_COALESCE_MS = 33
+
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight
+
+# Status label texts indexed by the boolean state
+_CAMERA_TEXTS = ("Camera: Inactive", "Camera: Active")
+_FACE_TEXTS = ("Face: Not detected", "Face: Detected")
+
+# Status chip states -> (text, ``state`` style property matched by the app QSS)
+_CHIP_STATES = {
+    "idle": ("Idle", "idle"),
+    "monitoring": ("Monitoring", "monitoring"),
+    "calibrating": ("Calibrating", "calibrating"),
+    "ready": ("Ready", "idle"),
+}
+
+# Fixed %-templates for the metric labels refreshed on every stats update
+_EAR_FMT = "%.3f"
+_RATE_FMT = "%.1f/min"
+_SINCE_FMT = "%.1fs"
+
+
+# Metric texts keyed by the value quantized to its displayed precision; steady
+# readings (stable EAR between blinks) become cache hits instead of % formatting
+@lru_cache(maxsize=4096)
+def _format_ear(milli: int) -> str:
+    """Format an EAR given in thousandths."""
+    return _EAR_FMT % (milli / 1000) if milli > 0 else "--"
+
+
+@lru_cache(maxsize=4096)
+def _format_rate(deci: int) -> str:
+    """Format a blink rate given in tenths per minute."""
+    return _RATE_FMT % (deci / 10) if deci > 0 else "--/min"
+
+
+@lru_cache(maxsize=4096)
+def _format_since(tenths: int) -> str:
+    """Format the time since the last blink given in tenths of a second."""
+    return _SINCE_FMT % (tenths / 10) if tenths >= 0 else "--s"
+
+
+def _normalize_cameras(cameras: list[tuple[int, str]]) -> list[tuple[int, str]]:
+    """Drop duplicate entries, order by device id and disambiguate shared names.
+
+    Args:
+        cameras: Raw ``(id, name)`` pairs from enumeration.
+
+    Returns:
+        Sorted, de-duplicated pairs; repeated names get an `` [id]`` suffix.
+    """
+    unique = sorted(set(cameras), key=lambda cam: cam[0])
+    name_counts: dict[str, int] = {}
+    for _, name in unique:
+        name_counts[name] = name_counts.get(name, 0) + 1
+    return [
+        (cam_id, f"{name} [{cam_id}]" if name_counts[name] > 1 else name)
+        for cam_id, name in unique
+    ]
+
+
+def _set_state(widget: QWidget, name: str, value) -> None:
+    """Set a dynamic style property and re-polish against the app stylesheet.
+
+    Re-polishing restyles the widget subtree, so it is skipped when the property
+    already holds ``value``.
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+def _set_active(widget: QWidget, active: bool) -> None:
+    """Toggle the ``active`` style property."""
+    _set_state(widget, "active", active)
+
+
+class _TaskSignals(QObject):
+    """Completion signals for pool tasks (QRunnable is not a QObject)."""
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class _DiagnosticsExportTask(QRunnable):
+    """Build the diagnostics archive off the GUI thread."""
+
+    def __init__(self, app_paths):
+        super().__init__()
+        self.app_paths = app_paths
+        self.signals = _TaskSignals()
+
+    def run(self) -> None:
+        """Zip logs + config and report the archive path."""
+        # Imported on demand; only needed when the user asks for a bundle
+        from blink.utils.diagnostics import export_diagnostics
+
+        try:
+            archive_path = export_diagnostics(self.app_paths)
+        except Exception as exc:
+            logger.error(f"Diagnostics export failed: {exc}")
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.finished.emit(str(archive_path))
+
+
+class _CameraEnumerationTask(QRunnable):
+    """Enumerate camera devices off the GUI thread."""
+
+    def __init__(self, camera_manager):
+        super().__init__()
+        self.camera_manager = camera_manager
+        self.signals = _TaskSignals()
+
+    def run(self) -> None:
+        """Probe devices and report the ``(id, name)`` list."""
+        self.signals.finished.emit(self.camera_manager.get_camera_info())
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
 
+    # Frames to be resampled off the GUI thread by the preview converter
+    preview_requested = pyqtSignal(object)
+
+    # Window shortcuts: (name, Settings field holding the key string, slot method)
+    _HOTKEYS = (
+        ("start_stop", "hotkey_start_stop", "_toggle_monitoring"),
+        ("pause", "hotkey_pause", "_emit_pause_30"),
+        ("test", "hotkey_test", "_trigger_test_animation"),
+    )
+
+    # Parsed hotkey strings, shared across instances and settings round-trips
+    _keyseq_cache: dict[str, QKeySequence] = {}
+
     def __init__(
         self,
         settings: Settings,
@@ -52,30 +235,73 @@ class MainWindow(QMainWindow):
         self.config_manager = config_manager
         self.app_paths = app_paths
         self.camera_manager = camera_manager
-        self._available_cameras = available_cameras or self.camera_manager.get_camera_info()
+        self._camera_cache: tuple[float, list[tuple[int, str]]] | None = None
+        if available_cameras:
+            self._store_cameras(available_cameras)
+        else:
+            self._available_cameras = self._refresh_available_cameras()
         self._monitoring = False
         self._camera_active = False
         self._face_detected = False
+        # Last text written per label, keyed by id(label)
+        self._label_cache: dict[int, str] = {}
+        # Metric values (quantized to displayed precision) behind the last render
+        self._last_render: dict[str, float] = {}
         self._calibrating = False
         self._preview_frame = None
         self._preview_enabled = False
+        self._preview_pixmap = QPixmap()
+        # Preview-only capture paused by hideEvent, resumed by showEvent
+        self._preview_suspended = False
 
         # Current metrics
         self._current_ear = 0.0
         self._blinks_per_minute = 0.0
         self._blinks_last_minute = 0
-        self._time_since_last_blink = 0.0
-
-        # Statistics update timer
-        self._stats_timer = QTimer(self)
-        self._stats_timer.timeout.connect(self._update_statistics_display)
-        self._preview_timer = QTimer(self)
-        self._preview_timer.timeout.connect(self._capture_preview_frame)
-
-        self._shortcuts: list[QShortcut] = []
+        # Monotonic ns of the last blink; "since last blink" is derived from it at render time
+        self._last_blink_mono: int | None = None
+        self._pending_stats: BlinkStats | None = None
+        self._stats_dirty = False
+        # Displayed fields of the last accepted snapshot
+        self._stats_key: tuple | None = None
+
+        # Trailing debounce so scrubbing the camera combo restarts capture once
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._selection_timer.setInterval(_CAMERA_SELECT_DEBOUNCE_MS)
+        self._selection_timer.timeout.connect(self._on_camera_selected)
+        # Coalesces camera/face/stats signals arriving together into one render
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(_STATUS_COALESCE_MS)
+        self._status_timer.timeout.connect(self._flush_status_update)
+        # Local ticker so "since last blink" advances between 1 Hz stats snapshots
+        self._since_timer = QTimer(self)
+        self._since_timer.setInterval(_SINCE_TICK_MS)
+        self._since_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._since_timer.timeout.connect(self._refresh_since_label)
+        # Trailing throttle for calibration progress; only the latest value is drawn
+        self._pending_progress = 0
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(_PROGRESS_COALESCE_MS)
+        self._progress_timer.timeout.connect(self._flush_calibration_progress)
+
+        self._shortcuts: dict[str, QShortcut] = {}
+        self._cached_hotkey_strings: dict[str, str] = {}
         self._camera_combo: QComboBox | None = None
+        self._camera_index_by_id: dict[int, int] = {}
+        self._diag_msgbox: QMessageBox | None = None
+        self._settings_dialog: "SettingsDialog | None" = None
+        self._diag_task: _DiagnosticsExportTask | None = None
+        self._enum_task: _CameraEnumerationTask | None = None
+        self._pending_save = False
+        # Preview-only start requested; waiting for the worker to report the camera
+        self._preview_opening = False
         self._init_ui()
         self._init_hotkeys()
+        self.signal_bus.error_occurred.connect(self._on_worker_error)
         self._update_status_display()
         self._clear_preview()
 
@@ -88,11 +314,10 @@ class MainWindow(QMainWindow):
         """Fill the camera combo box with available devices."""
         if not self._camera_combo:
             return
-        self._camera_combo.clear()
         # Prefer the cached list from app startup (same one Settings dialog sees)
         cameras = self._available_cameras or []
         if not cameras:
-            cameras = self.camera_manager.get_camera_info()
+            cameras = self._refresh_available_cameras()
         logger.info(f"Main window camera enumerate -> {cameras}")
         if cameras:
             self._available_cameras = cameras
@@ -101,44 +326,34 @@ class MainWindow(QMainWindow):
             cameras = [(i, f"Camera {i}") for i in range(0, 3)]
         self._camera_combo.setEnabled(True)
         self._camera_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
-        for cam_id, cam_name in cameras:
-            display = cam_name or f"Camera {cam_id}"
-            self._camera_combo.addItem(display, cam_id)
-        # Set current selection
-        idx = self._camera_combo.findData(self.settings.camera_id)
-        if idx >= 0:
-            self._camera_combo.setCurrentIndex(idx)
-        else:
-            self._camera_combo.setCurrentIndex(0)
+        # Build the rows off-widget and swap the model in once; signals stay
+        # blocked so population never reaches the selection handler
+        model = QStandardItemModel(self._camera_combo)
+        index_by_id: dict[int, int] = {}
+        for row, (cam_id, cam_name) in enumerate(cameras):
+            item = QStandardItem(cam_name or f"Camera {cam_id}")
+            item.setData(cam_id, Qt.ItemDataRole.UserRole)
+            model.appendRow(item)
+            index_by_id.setdefault(cam_id, row)
+        self._camera_index_by_id = index_by_id
+        idx = index_by_id.get(self.settings.camera_id, -1)
+        self._camera_combo.blockSignals(True)
+        try:
+            self._camera_combo.setModel(model)
+            self._camera_combo.setCurrentIndex(max(idx, 0))
+        finally:
+            self._camera_combo.blockSignals(False)
+        if idx < 0:
             self.settings.camera_id = self._camera_combo.currentData()
-            self.config_manager.save(self.settings)
+            self._schedule_settings_save()
         self._camera_combo.setMinimumWidth(200)
     def _init_ui(self) -> None:
         """Initialize UI components with a high-contrast, non-overlapping layout."""
         self.setWindowTitle("Blink! - Eye Health Monitor")
         self.setMinimumSize(1040, 760)
         self.resize(1180, 820)
-        self.setStyleSheet(
-            """
-            QMainWindow { background: #0b1220; }
-            QLabel { color: #e5e7eb; }
-            QLabel#Title { font-size: 28px; font-weight: 800; color: #e8edf5; letter-spacing: 0.3px; }
-            QLabel#Subtitle { color: #94a3b8; font-size: 13px; }
-            QLabel#SectionTitle { color: #e5e7eb; font-size: 14px; font-weight: 700; }
-            QLabel#StatLabel { color: #94a3b8; font-size: 12px; }
-            QLabel#StatValue { color: #e8edf5; font-size: 26px; font-weight: 750; }
-            QLabel#Chip { background: #1e293b; color: #e2e8f0; padding: 6px 12px; border-radius: 16px; font-weight: 700; }
-            QWidget#Card { background: #111a2f; border: 1px solid #1f2c46; border-radius: 14px; }
-            QPushButton { font-size: 14px; padding: 12px; border-radius: 10px; border: none; font-weight: 700; }
-            QPushButton#Primary { background: #22c55e; color: #0b1220; }
-            QPushButton#Accent { background: #0ea5e9; color: #0b1220; }
-            QPushButton#Neutral { background: #1e293b; color: #e2e8f0; }
-            QPushButton#Warning { background: #f59e0b; color: #0b1220; }
-            QPushButton:disabled { background: #1f2f46; color: #7c879e; }
-            QProgressBar { background: #0f172a; color: #e5e7eb; border: 1px solid #1f2c46; border-radius: 8px; text-align: center; }
-            QProgressBar::chunk { background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #38bdf8, stop:1 #22d3ee); border-radius: 8px; }
-            """
-        )
+        # Resolve the large stylesheet once app-wide instead of per window subtree
+        QApplication.instance().setStyleSheet(_MAIN_QSS)
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -163,9 +378,9 @@ class MainWindow(QMainWindow):
 
         self._monitoring_chip = QLabel("Idle")
         self._monitoring_chip.setObjectName("Chip")
-        self._monitoring_chip.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._monitoring_chip.setAlignment(_ALIGN_CENTER)
         self._monitoring_chip.setMinimumWidth(120)
-        header.addWidget(self._monitoring_chip, alignment=Qt.AlignmentFlag.AlignRight)
+        header.addWidget(self._monitoring_chip, alignment=_ALIGN_RIGHT)
 
         root.addLayout(header)
 
@@ -202,11 +417,9 @@ class MainWindow(QMainWindow):
         left_col.setSpacing(12)
 
         self._preview_label = QLabel("Preview not available")
-        self._preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._preview_label.setAlignment(_ALIGN_CENTER)
         self._preview_label.setMinimumHeight(260)
-        self._preview_label.setStyleSheet(
-            "color: #cbd5e1; border: 1px dashed #1f2c46; background: #0d1424; border-radius: 10px;"
-        )
+        self._preview_label.setObjectName("Preview")
         preview_card = self._wrap_card("Camera preview", self._preview_label)
         left_col.addWidget(preview_card)
 
@@ -216,14 +429,14 @@ class MainWindow(QMainWindow):
         status_layout.setContentsMargins(0, 0, 0, 0)
 
         self._camera_status_label = QLabel("Camera: Inactive")
-        self._camera_status_label.setObjectName("SectionTitle")
+        self._camera_status_label.setObjectName("CameraStatus")
         self._face_status_label = QLabel("Face: Not detected")
-        self._face_status_label.setObjectName("SectionTitle")
+        self._face_status_label.setObjectName("FaceStatus")
         status_layout.addWidget(self._camera_status_label)
         status_layout.addWidget(self._face_status_label)
 
         self._status_note = QLabel("Waiting to start monitoring")
-        self._status_note.setStyleSheet("color: #94a3b8; font-size: 12px;")
+        self._status_note.setObjectName("Helper")
         status_layout.addWidget(self._status_note)
 
         status_card = QWidget(objectName="Card")
@@ -241,6 +454,7 @@ class MainWindow(QMainWindow):
         controls_layout = QVBoxLayout(controls_card)
         controls_layout.setContentsMargins(14, 14, 14, 14)
         controls_layout.setSpacing(10)
+        self._controls_layout = controls_layout
 
         # Camera quick picker
         camera_row = QHBoxLayout()
@@ -249,14 +463,15 @@ class MainWindow(QMainWindow):
         camera_label.setObjectName("SectionTitle")
         self._camera_combo = QComboBox()
         self._populate_camera_combo()
-        self._camera_combo.currentIndexChanged.connect(self._on_camera_selected)
-        refresh_btn = QPushButton("Refresh")
-        refresh_btn.setObjectName("Neutral")
-        refresh_btn.setMinimumHeight(32)
-        refresh_btn.clicked.connect(self._refresh_camera_list)
+        # activated is user-initiated only; repopulating the model stays silent
+        self._camera_combo.activated.connect(self._schedule_camera_selection)
+        self._refresh_button = QPushButton("Refresh")
+        self._refresh_button.setObjectName("Neutral")
+        self._refresh_button.setMinimumHeight(32)
+        self._refresh_button.clicked.connect(self._refresh_camera_list)
         camera_row.addWidget(camera_label)
         camera_row.addWidget(self._camera_combo, stretch=1)
-        camera_row.addWidget(refresh_btn)
+        camera_row.addWidget(self._refresh_button)
         controls_layout.addLayout(camera_row)
 
         self._start_button = QPushButton("Start monitoring")
@@ -272,11 +487,8 @@ class MainWindow(QMainWindow):
         self._calibrate_button.setEnabled(False)
         controls_layout.addWidget(self._calibrate_button)
 
-        self._calibration_progress = QProgressBar()
-        self._calibration_progress.setRange(0, 100)
-        self._calibration_progress.setValue(0)
-        self._calibration_progress.setVisible(False)
-        controls_layout.addWidget(self._calibration_progress)
+        # Built on first calibration; most sessions never calibrate
+        self._calibration_progress: QProgressBar | None = None
 
         action_grid = QGridLayout()
         action_grid.setHorizontalSpacing(8)
@@ -315,7 +527,7 @@ class MainWindow(QMainWindow):
         controls_layout.addLayout(action_grid)
 
         helper = QLabel("Run monitoring to see live stats. Preview uses your selected camera and resolution.")
-        helper.setStyleSheet("color: #94a3b8; font-size: 12px;")
+        helper.setObjectName("Helper")
         helper.setWordWrap(True)
         controls_layout.addWidget(helper)
 
@@ -324,24 +536,61 @@ class MainWindow(QMainWindow):
         root.addLayout(body)
         root.addStretch()
 
-        self._set_status_chip("Idle", "#1e293b", "#e2e8f0")
+        self._set_status_chip("idle")
 
-    def _init_hotkeys(self) -> None:
-        """Register global-ish shortcuts within the window."""
-        for sc in self._shortcuts:
-            sc.setParent(None)
-        self._shortcuts = []
-
-        shortcut_start = QShortcut(QKeySequence(self.settings.hotkey_start_stop), self)
-        shortcut_start.activated.connect(self._toggle_monitoring)
+    def _ensure_calibration_progress(self) -> QProgressBar:
+        """Create the calibration progress bar below the calibrate button on first use."""
+        if self._calibration_progress is None:
+            progress = QProgressBar()
+            progress.setRange(0, 100)
+            progress.setValue(0)
+            progress.setVisible(False)
+            index = self._controls_layout.indexOf(self._calibrate_button) + 1
+            self._controls_layout.insertWidget(index, progress)
+            self._calibration_progress = progress
+        return self._calibration_progress
 
-        shortcut_pause = QShortcut(QKeySequence(self.settings.hotkey_pause), self)
-        shortcut_pause.activated.connect(lambda: self.signal_bus.pause_for_duration.emit(30))
+    def _init_hotkeys(self) -> None:
+        """Register global-ish shortcuts within the window.
 
-        shortcut_test = QShortcut(QKeySequence(self.settings.hotkey_test), self)
-        shortcut_test.activated.connect(self._trigger_test_animation)
+        Each shortcut is created and connected exactly once, re-keyed in place when
+        its hotkey string changes, and torn down when the hotkey is cleared.
+        """
+        hotkeys = {name: getattr(self.settings, field) for name, field, _ in self._HOTKEYS}
+        if hotkeys == self._cached_hotkey_strings:
+            return
 
-        self._shortcuts.extend([shortcut_start, shortcut_pause, shortcut_test])
+        for name, _, slot_name in self._HOTKEYS:
+            sequence = hotkeys[name]
+            if sequence == self._cached_hotkey_strings.get(name):
+                continue
+            shortcut = self._shortcuts.get(name)
+            if not sequence:
+                if shortcut is not None:
+                    shortcut.activated.disconnect()
+                    shortcut.deleteLater()
+                    del self._shortcuts[name]
+            elif shortcut is None:
+                shortcut = QShortcut(self._keyseq(sequence), self)
+                shortcut.activated.connect(getattr(self, slot_name))
+                self._shortcuts[name] = shortcut
+            else:
+                shortcut.setKey(self._keyseq(sequence))
+
+        self._cached_hotkey_strings = hotkeys
+
+    @classmethod
+    def _keyseq(cls, sequence: str) -> QKeySequence:
+        """Return a parsed key sequence, reusing earlier parses of the same string."""
+        kseq = cls._keyseq_cache.get(sequence)
+        if kseq is None:
+            kseq = cls._keyseq_cache[sequence] = QKeySequence(sequence)
+        return kseq
+
+    @pyqtSlot()
+    def _emit_pause_30(self) -> None:
+        """Pause reminders for 30 minutes (hotkey target)."""
+        self.signal_bus.pause_for_duration.emit(30)
 
     def _build_stat_card(self, title: str, value_label: QLabel, helper_text: str = "") -> QWidget:
         """Create a compact stat card with label + value + helper copy."""
@@ -352,13 +601,12 @@ class MainWindow(QMainWindow):
 
         label = QLabel(title)
         label.setObjectName("StatLabel")
-        value_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
         layout.addWidget(label)
         layout.addWidget(value_label)
 
         if helper_text:
             helper = QLabel(helper_text)
-            helper.setStyleSheet("color: #94a3b8; font-size: 12px;")
+            helper.setObjectName("Helper")
             layout.addWidget(helper)
 
         return card
@@ -375,51 +623,67 @@ class MainWindow(QMainWindow):
         layout.addWidget(inner_widget)
         return card
 
-    def _set_status_chip(self, text: str, bg: str, fg: str) -> None:
-        """Update the status chip text and colors."""
-        self._monitoring_chip.setText(text)
-        self._monitoring_chip.setStyleSheet(
-            f"background: {bg}; color: {fg}; padding: 6px 12px; border-radius: 16px; "
-            "font-weight: 700;"
-        )
+    def _set_label(self, label: QLabel, text: str) -> bool:
+        """Write label text only when it differs from the last write.
+
+        Args:
+            label: Label to update.
+            text: New text.
+
+        Returns:
+            True if the text was written.
+        """
+        key = id(label)
+        if self._label_cache.get(key) == text:
+            return False
+        label.setText(text)
+        self._label_cache[key] = text
+        return True
+
+    def _set_status_chip(self, state_key: str) -> None:
+        """Switch the status chip to one of the precomputed ``_CHIP_STATES``."""
+        text, state = _CHIP_STATES[state_key]
+        self._set_label(self._monitoring_chip, text)
+        _set_state(self._monitoring_chip, "state", state)
 
     def _toggle_monitoring(self, force_stop: bool = False) -> None:
         """Toggle monitoring state."""
-        if self._preview_timer.isActive():
-            self._preview_timer.stop()
+        if self._preview_enabled and not self._monitoring:
+            # Monitoring takes over the preview-only stream
+            self._preview_enabled = False
+            self._preview_opening = False
+            self._preview_button.setEnabled(True)
             self._preview_button.setText("Preview camera")
 
         # Auto-enable camera when starting
         if not force_stop and not self._monitoring and not self.settings.camera_enabled:
             self.settings.camera_enabled = True
             self._camera_enable_check.setChecked(True)
-            self.config_manager.save(self.settings)
+            self._schedule_settings_save()
             self.signal_bus.camera_enabled_changed.emit(True)
 
         self._monitoring = not force_stop and not self._monitoring
 
         if self._monitoring:
             self._start_button.setText("Stop monitoring")
-            self._start_button.setStyleSheet(
-                "background: #ef4444; color: #0b1220; font-weight: 700; border-radius: 10px; padding: 12px;"
-            )
+            _set_state(self._start_button, "state", "stop")
             self._calibrate_button.setEnabled(True)
-            self._stats_timer.start(1000)
-            self._status_note.setText("Monitoring in progress")
-            self._set_status_chip("Monitoring", "#14532d", "#d1fae5")
+            self._set_label(self._status_note, "Monitoring in progress")
+            self._set_status_chip("monitoring")
             logger.info("Monitoring started from UI")
             self.signal_bus.start_monitoring.emit()
         else:
             self._start_button.setText("Start monitoring")
-            self._start_button.setStyleSheet(
-                "background: #22c55e; color: #0b1220; font-weight: 700; border-radius: 10px; padding: 12px;"
-            )
+            _set_state(self._start_button, "state", "start")
+            # Calibration disables the button; stopping mid-run must hand it back
+            self._start_button.setEnabled(True)
             self._calibrate_button.setEnabled(False)
-            self._calibration_progress.setVisible(False)
+            self._progress_timer.stop()
+            if self._calibration_progress is not None:
+                self._calibration_progress.setVisible(False)
             self._calibrating = False
-            self._stats_timer.stop()
             self._reset_status()
-            self._set_status_chip("Idle", "#1e293b", "#e2e8f0")
+            self._set_status_chip("idle")
             if not self._preview_enabled:
                 self._clear_preview()
             logger.info("Monitoring stopped from UI")
@@ -428,47 +692,46 @@ class MainWindow(QMainWindow):
     def _start_calibration(self) -> None:
         """Start calibration process."""
         self._calibrating = True
-        self._calibration_progress.setValue(0)
-        self._calibration_progress.setVisible(True)
+        progress = self._ensure_calibration_progress()
+        progress.setValue(0)
+        self._pending_progress = 0
+        progress.setVisible(True)
         self._calibrate_button.setEnabled(False)
         self._start_button.setEnabled(False)
-        self._status_note.setText("Calibrating eye aspect ratio baseline...")
-        self._set_status_chip("Calibrating", "#854d0e", "#fef9c3")
+        self._set_label(self._status_note, "Calibrating eye aspect ratio baseline...")
+        self._set_status_chip("calibrating")
 
         logger.info("Calibration started from UI")
-
-        # Signal to start calibration (would connect to vision worker in app.py)
-        # For now, simulate calibration completion after 5 seconds
-        QTimer.singleShot(5000, self._calibration_complete)
-
-    def _calibration_complete(self) -> None:
-        """Handle calibration completion."""
-        self._calibrating = False
-        self._calibration_progress.setVisible(False)
-        self._calibrate_button.setEnabled(True)
-        self._start_button.setEnabled(True)
-        self._status_note.setText("Calibration complete. Resume monitoring to apply.")
-        self._set_status_chip("Ready", "#1e293b", "#e2e8f0")
-
-        logger.info("Calibration complete")
+        # Completion arrives from the vision worker via on_calibration_complete
+        self.signal_bus.start_calibration.emit()
 
     def _open_settings(self) -> None:
         """Open settings dialog."""
         was_monitoring = self._monitoring
-        was_preview = self._preview_timer.isActive()
+        was_preview = self._preview_enabled and not self._monitoring
         if was_monitoring:
             self._toggle_monitoring()
         elif was_preview:
             self._toggle_preview()
 
-        dialog = SettingsDialog(
-            self.settings,
-            parent=self,
-            available_cameras=self._refresh_available_cameras(),
-        )
+        # Built once; later opens only reload values into the existing widgets
+        cameras = self._refresh_available_cameras()
+        dialog = self._settings_dialog
+        if dialog is None:
+            # Imported on first open; many sessions never show the dialog
+            from blink.ui.settings_dialog import SettingsDialog
+
+            dialog = self._settings_dialog = SettingsDialog(
+                self.settings,
+                parent=self,
+                available_cameras=cameras,
+                refresh_cameras=self._refresh_camera_list,
+            )
+        else:
+            dialog.load(self.settings, cameras)
         if dialog.exec():
             self.settings = dialog.get_settings()
-            self.config_manager.save(self.settings)
+            self._schedule_settings_save()
             self.signal_bus.settings_changed.emit(self.settings)
             self._init_hotkeys()  # refresh shortcuts
             logger.info("Settings updated from dialog")
@@ -476,7 +739,7 @@ class MainWindow(QMainWindow):
         # Restore previous run state
         if was_monitoring and not self._monitoring:
             self._toggle_monitoring()
-        elif was_preview and not self._preview_timer.isActive():
+        elif was_preview and not self._preview_enabled:
             self._toggle_preview()
 
     def _trigger_test_animation(self) -> None:
@@ -484,9 +747,46 @@ class MainWindow(QMainWindow):
         self.signal_bus.test_animation.emit()
 
     def _export_diagnostics(self) -> None:
-        """Export logs + config bundle."""
-        archive_path = export_diagnostics(self.app_paths)
-        QMessageBox.information(self, "Diagnostics exported", f"Saved to:\n{archive_path}")
+        """Export logs + config bundle on a pool thread."""
+        if self._diag_task is not None:
+            return
+        self._export_button.setEnabled(False)
+        self._export_button.setText("Exporting…")
+        self._diag_task = _DiagnosticsExportTask(self.app_paths)
+        self._diag_task.signals.finished.connect(self._on_diagnostics_exported)
+        self._diag_task.signals.failed.connect(self._on_diagnostics_failed)
+        QThreadPool.globalInstance().start(self._diag_task)
+
+    @pyqtSlot(object)
+    def _on_diagnostics_exported(self, archive_path: str) -> None:
+        """Report the finished diagnostics bundle."""
+        self._finish_diagnostics_export()
+        self._show_diagnostics_result(
+            QMessageBox.Icon.Information, "Diagnostics exported", f"Saved to:\n{archive_path}"
+        )
+
+    @pyqtSlot(str)
+    def _on_diagnostics_failed(self, error: str) -> None:
+        """Report a diagnostics export that raised on the pool thread."""
+        self._finish_diagnostics_export()
+        self._show_diagnostics_result(
+            QMessageBox.Icon.Warning, "Diagnostics export failed", f"Could not export diagnostics:\n{error}"
+        )
+
+    def _finish_diagnostics_export(self) -> None:
+        """Restore the export button once the pool task reports back."""
+        self._diag_task = None
+        self._export_button.setText("Export diagnostics")
+        self._export_button.setEnabled(True)
+
+    def _show_diagnostics_result(self, icon: QMessageBox.Icon, title: str, text: str) -> None:
+        """Show the export outcome in the reused message box."""
+        if self._diag_msgbox is None:
+            self._diag_msgbox = QMessageBox(self)
+        self._diag_msgbox.setIcon(icon)
+        self._diag_msgbox.setWindowTitle(title)
+        self._diag_msgbox.setText(text)
+        self._diag_msgbox.exec()
 
     def _reset_status(self) -> None:
         """Reset status displays."""
@@ -495,54 +795,119 @@ class MainWindow(QMainWindow):
         self._current_ear = 0.0
         self._blinks_per_minute = 0.0
         self._blinks_last_minute = 0
-        self._time_since_last_blink = 0.0
-        self._status_note.setText("Waiting to start monitoring")
+        self._last_blink_mono = None
+        self._since_timer.stop()
+        # A coalesced render still pending would only repeat this reset pass
+        self._status_timer.stop()
+        self._stats_dirty = False
+        self._stats_key = None
+        self._set_label(self._status_note, "Waiting to start monitoring")
         self._update_status_display()
 
     def _update_status_display(self) -> None:
-        if self._camera_active:
-            self._camera_status_label.setText("Camera: Active")
-            self._camera_status_label.setStyleSheet("color: #22c55e; font-size: 13px; font-weight: 700;")
-        else:
-            self._camera_status_label.setText("Camera: Inactive")
-            self._camera_status_label.setStyleSheet("color: #f87171; font-size: 13px; font-weight: 700;")
-
-        if self._face_detected:
-            self._face_status_label.setText("Face: Detected")
-            self._face_status_label.setStyleSheet("color: #22c55e; font-size: 13px; font-weight: 700;")
-            self._status_note.setText("Face detected. Tracking blinks.")
-        else:
-            self._face_status_label.setText("Face: Not detected")
-            self._face_status_label.setStyleSheet("color: #e5e7eb; font-size: 13px; font-weight: 700;")
-            if self._monitoring:
-                self._status_note.setText("Looking for your face... please center in frame.")
-
-        ear_text = f"{self._current_ear:.3f}" if self._current_ear > 0 else "--"
-        self._ear_value_label.setText(ear_text)
-
-        blink_rate_text = f"{self._blinks_per_minute:.1f}/min" if self._blinks_per_minute > 0 else "--/min"
-        self._blink_rate_label.setText(blink_rate_text)
+        """Refresh every status label (used on reset and first paint)."""
+        if not self.isVisible():
+            # Hidden to tray: showEvent repaints everything once the window returns
+            return
+        with self._batched():
+            self._refresh_camera_label()
+            self._refresh_face_label()
+            self._refresh_ear_label()
+            self._refresh_stats_label()
+
+    @contextmanager
+    def _batched(self):
+        """Suspend painting of the window body so a burst of label writes lands in one repaint."""
+        central = self.centralWidget()
+        central.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            # Re-enabling schedules a single update for the whole region
+            central.setUpdatesEnabled(True)
 
-        last_min_text = str(self._blinks_last_minute) if self._blinks_last_minute > 0 else "--"
-        self._last_min_label.setText(last_min_text)
+    def _refresh_camera_label(self) -> None:
+        """Update the camera status label on state transitions only."""
+        if self._set_label(self._camera_status_label, _CAMERA_TEXTS[self._camera_active]):
+            _set_active(self._camera_status_label, self._camera_active)
 
-        since_text = f"{self._time_since_last_blink:.1f}s" if self._time_since_last_blink > 0 else "--s"
-        self._since_last_label.setText(since_text)
+    def _refresh_face_label(self) -> None:
+        """Update the face status label and the status note."""
+        if self._set_label(self._face_status_label, _FACE_TEXTS[self._face_detected]):
+            _set_active(self._face_status_label, self._face_detected)
 
+        if self._face_detected:
+            self._set_label(self._status_note, "Face detected. Tracking blinks.")
+        elif self._monitoring:
+            self._set_label(self._status_note, "Looking for your face... please center in frame.")
+
+    def _refresh_ear_label(self) -> None:
+        """Update the EAR value label when its value changes."""
+        milli = round(self._current_ear * 1000)
+        if self._metric_changed("ear", milli):
+            self._set_label(self._ear_value_label, _format_ear(milli))
+
+    def _refresh_stats_label(self) -> None:
+        """Update the blink statistic labels whose values changed."""
+        deci = round(self._blinks_per_minute * 10)
+        if self._metric_changed("rate", deci):
+            self._set_label(self._blink_rate_label, _format_rate(deci))
+
+        if self._metric_changed("count", self._blinks_last_minute):
+            count_text = str(self._blinks_last_minute) if self._blinks_last_minute > 0 else "--"
+            self._set_label(self._last_min_label, count_text)
+
+        self._refresh_since_label()
+
+    def _refresh_since_label(self) -> None:
+        """Update only the since-last-blink label from the monotonic anchor."""
+        # Quantized to the 0.1 s the label shows, so ticks within one step skip formatting
+        if self._last_blink_mono is None:
+            tenths = -1
+        else:
+            tenths = (time.monotonic_ns() - self._last_blink_mono) // 100_000_000
+        if self._metric_changed("since", tenths):
+            self._set_label(self._since_last_label, _format_since(tenths))
+
+    def _metric_changed(self, key: str, value: float) -> bool:
+        """Record a metric value and report whether it differs from the last render."""
+        if self._last_render.get(key) == value:
+            return False
+        self._last_render[key] = value
+        return True
+
+    def _schedule_status_update(self) -> None:
+        """Queue a coalesced status render unless one is already pending."""
+        if self.isVisible() and not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status_update(self) -> None:
+        """Apply pending statistics and refresh all status labels in one pass."""
+        self._update_statistics_display()
+        # Every label write of the flush lands inside the single batched repaint
+        self._update_status_display()
 
-    def _update_statistics_display(self, *args) -> None:
-        """Update statistics display (called with args for signal connection)."""
-        if not self._monitoring:
+    def _update_statistics_display(self) -> None:
+        """Apply the latest pending statistics snapshot delivered by ``update_statistics``."""
+        if not self._monitoring or not self._stats_dirty or not self.isVisible():
             return
-        self._update_status_display()
+        stats = self._pending_stats
+        self._stats_dirty = False
+        self._current_ear = stats.current_ear
+        self._blinks_per_minute = stats.blinks_per_minute
+        self._blinks_last_minute = stats.blinks_last_minute
+        since = stats.time_since_last_blink_seconds
+        self._last_blink_mono = time.monotonic_ns() - int(since * 1e9) if since > 0 else None
+        if self._last_blink_mono is None:
+            self._since_timer.stop()
+        elif not self._since_timer.isActive() and not self.isMinimized():
+            self._since_timer.start()
 
     def _toggle_preview(self) -> None:
         """Toggle lightweight preview without full monitoring."""
         if self._preview_enabled:
             self._preview_enabled = False
             self._preview_button.setText("Preview camera")
-            if self._preview_timer.isActive():
-                self._preview_timer.stop()
             if not self._monitoring:
                 self.signal_bus.stop_preview.emit()
             self._clear_preview()
@@ -556,24 +921,68 @@ class MainWindow(QMainWindow):
         if not self.settings.camera_enabled:
             self.settings.camera_enabled = True
             self._camera_enable_check.setChecked(True)
-            self.config_manager.save(self.settings)
+            self._schedule_settings_save()
             self.signal_bus.camera_enabled_changed.emit(True)
 
         if self._monitoring:
             # When monitoring is running, we reuse worker-emitted preview frames.
             return
 
-        # Preview-only mode: ask worker to capture on its thread
+        # Preview-only mode: the worker opens the camera on its thread and pushes frames to
+        # show_preview; the button stays parked until it reports back
+        self._preview_opening = True
+        self._preview_button.setEnabled(False)
+        self._preview_button.setText("Opening camera…")
         self.signal_bus.start_preview.emit()
-        self._preview_timer.start(150)  # poll display refresh cadence
 
-    def _capture_preview_frame(self) -> None:
-        """Capture single frame for preview."""
-        if not self._preview_enabled:
-            return
-        # In preview-only mode, we rely on worker emitting preview frames.
-        # This timer simply ensures the label updates if frames arrive.
-        pass
+    def _finish_preview_opening(self, opened: bool) -> None:
+        """Release the preview button once the worker reports the camera state.
+
+        Args:
+            opened: Whether the camera came up for the preview.
+        """
+        self._preview_opening = False
+        self._preview_button.setEnabled(True)
+        if opened:
+            self._preview_button.setText("Stop preview")
+        else:
+            self._preview_enabled = False
+            self._preview_button.setText("Preview camera")
+
+    @pyqtSlot(str)
+    def _on_worker_error(self, message: str) -> None:
+        """Abort a pending preview start when the worker reports an error."""
+        if self._preview_opening:
+            self._finish_preview_opening(False)
+
+    def showEvent(self, event) -> None:
+        """Catch up on state that changed while the window was hidden.
+
+        Args:
+            event: Show event.
+        """
+        super().showEvent(event)
+        self._status_timer.stop()
+        self._flush_status_update()
+        if self._last_blink_mono is not None and not self._since_timer.isActive():
+            self._since_timer.start()
+        if self._preview_suspended:
+            self._preview_suspended = False
+            if self._preview_enabled and not self._monitoring:
+                self.signal_bus.start_preview.emit()
+
+    def hideEvent(self, event) -> None:
+        """Release the camera held only for the preview while nobody can see it.
+
+        Args:
+            event: Hide event (also delivered on minimize).
+        """
+        super().hideEvent(event)
+        # Nothing to tick while hidden; showEvent re-derives the label from the anchor
+        self._since_timer.stop()
+        if self._preview_enabled and not self._monitoring and not self._preview_suspended:
+            self._preview_suspended = True
+            self.signal_bus.stop_preview.emit()
 
     def closeEvent(self, event) -> None:
         """Handle window close event.
@@ -602,7 +1011,7 @@ class MainWindow(QMainWindow):
         """Enable/disable camera from the main window toggle."""
         enabled = self._camera_enable_check.isChecked()
         self.settings.camera_enabled = enabled
-        self.config_manager.save(self.settings)
+        self._schedule_settings_save()
         self.signal_bus.camera_enabled_changed.emit(enabled)
         # If camera was disabled while monitoring, stop to release resources
         if not enabled and self._monitoring:
@@ -610,19 +1019,66 @@ class MainWindow(QMainWindow):
         status = "enabled" if enabled else "disabled"
         logger.info(f"Camera {status} via main window toggle")
 
-    def _refresh_available_cameras(self) -> list[tuple[int, str]]:
-        """Refresh and cache camera list."""
-        self._available_cameras = self.camera_manager.get_camera_info()
+    def _schedule_settings_save(self) -> None:
+        """Persist settings on the next event-loop turn, merging saves from one gesture."""
+        if not self._pending_save:
+            self._pending_save = True
+            QTimer.singleShot(0, self._flush_settings_save)
+
+    def _flush_settings_save(self) -> None:
+        """Write settings to disk if a save is still pending."""
+        if not self._pending_save:
+            return
+        self._pending_save = False
+        self.config_manager.save(self.settings)
+
+    def _refresh_available_cameras(self, force: bool = False) -> list[tuple[int, str]]:
+        """Return the camera list, re-enumerating only when the cache is stale.
+
+        Args:
+            force: Bypass the TTL cache (user-initiated refresh).
+        """
+        now = time.monotonic()
+        if not force and self._camera_cache and now - self._camera_cache[0] < _CAMERA_CACHE_TTL:
+            self._available_cameras = self._camera_cache[1]
+            return self._available_cameras
+        return self._store_cameras(self.camera_manager.get_camera_info())
+
+    def _store_cameras(self, cameras: list[tuple[int, str]]) -> list[tuple[int, str]]:
+        """Normalize a fresh enumeration and make it the cached camera list."""
+        self._available_cameras = _normalize_cameras(cameras)
+        self._camera_cache = (time.monotonic(), self._available_cameras)
         return self._available_cameras
 
     def _refresh_camera_list(self) -> None:
-        """Force re-enumeration of cameras and repopulate dropdown."""
-        self._available_cameras = self.camera_manager.get_camera_info()
-        logger.info(f"Camera list refreshed: {self._available_cameras}")
+        """Force re-enumeration of cameras on a pool thread and repopulate dropdown."""
+        # Rapid clicks coalesce into the enumeration already in flight
+        if self._enum_task is not None:
+            return
+        self._refresh_button.setEnabled(False)
+        self._enum_task = _CameraEnumerationTask(self.camera_manager)
+        self._enum_task.signals.finished.connect(self._on_cameras_enumerated)
+        QThreadPool.globalInstance().start(self._enum_task)
+
+    @pyqtSlot(object)
+    def _on_cameras_enumerated(self, cameras: list[tuple[int, str]]) -> None:
+        """Store a finished enumeration and rebuild the dropdown."""
+        self._enum_task = None
+        self._refresh_button.setEnabled(True)
+        cameras = self._store_cameras(cameras)
+        logger.info(f"Camera list refreshed: {cameras}")
         self._populate_camera_combo()
+        # Keep the settings dialog's list in step with the main combo
+        if self._settings_dialog is not None:
+            self._settings_dialog.update_cameras(cameras)
+
+    @pyqtSlot(int)
+    def _schedule_camera_selection(self, _index: int) -> None:
+        """Restart the selection debounce on every user pick in the combo."""
+        self._selection_timer.start()
 
     def _on_camera_selected(self) -> None:
-        """Handle camera selection change from the main screen."""
+        """Apply the settled camera selection from the main screen."""
         if not self._camera_combo:
             return
         cam_id = self._camera_combo.currentData()
@@ -633,7 +1089,7 @@ class MainWindow(QMainWindow):
             return
 
         self.settings.camera_id = cam_id
-        self.config_manager.save(self.settings)
+        self._schedule_settings_save()
         logger.info(f"Camera changed from main window to ID {cam_id}")
         # Propagate to worker and other components
         self.signal_bus.settings_changed.emit(self.settings)
@@ -654,7 +1110,9 @@ class MainWindow(QMainWindow):
             active: Whether camera is active.
         """
         self._camera_active = active
-        self._update_status_display()
+        if self._preview_opening:
+            self._finish_preview_opening(active)
+        self._schedule_status_update()
 
     @pyqtSlot(bool)
     def set_face_detected(self, detected: bool) -> None:
@@ -664,20 +1122,28 @@ class MainWindow(QMainWindow):
             detected: Whether face is detected.
         """
         self._face_detected = detected
-        self._update_status_display()
+        self._schedule_status_update()
 
-    @pyqtSlot(dict)
-    def update_statistics(self, stats: dict) -> None:
+    @pyqtSlot(object)
+    def update_statistics(self, stats: BlinkStats) -> None:
         """Update statistics from vision worker.
 
+        The worker only emits when the snapshot changes (at most 1 Hz), so the
+        window renders on arrival instead of polling on a timer; the render is
+        merged with any camera/face change from the same frame.
+
         Args:
-            stats: Statistics dictionary.
+            stats: Statistics snapshot.
         """
-        self._current_ear = stats.get("current_ear", 0.0)
-        self._blinks_per_minute = stats.get("blinks_per_minute", 0.0)
-        self._blinks_last_minute = stats.get("blinks_last_minute", 0)
-        self._time_since_last_blink = stats.get("time_since_last_blink_seconds", 0.0)
-        self._update_status_display()
+        # The worker already rounds to display precision; snapshots differing only in
+        # fields the window does not show (totals, open-eye time) need no render
+        key = stats[:4]
+        if key == self._stats_key:
+            return
+        self._stats_key = key
+        self._pending_stats = stats
+        self._stats_dirty = True
+        self._schedule_status_update()
 
     @pyqtSlot(int)
     def update_calibration_progress(self, progress: int) -> None:
@@ -686,7 +1152,17 @@ class MainWindow(QMainWindow):
         Args:
             progress: Progress percentage (0-100).
         """
-        self._calibration_progress.setValue(progress)
+        # Several frames map to the same whole percent; repeats need no repaint
+        if progress == self._pending_progress:
+            return
+        self._pending_progress = progress
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_calibration_progress(self) -> None:
+        """Draw the most recent calibration progress value."""
+        if self._calibrating:
+            self._ensure_calibration_progress().setValue(self._pending_progress)
 
     @pyqtSlot(float)
     def on_calibration_complete(self, threshold: float) -> None:
@@ -696,12 +1172,45 @@ class MainWindow(QMainWindow):
             threshold: Calibrated EAR threshold.
         """
         self._calibrating = False
-        self._calibration_progress.setVisible(False)
+        self._progress_timer.stop()
+        if self._calibration_progress is not None:
+            self._calibration_progress.setVisible(False)
         self._calibrate_button.setEnabled(True)
         self._start_button.setEnabled(True)
+        if self._monitoring:
+            self._set_label(self._status_note, "Calibration complete. Monitoring in progress")
+            self._set_status_chip("monitoring")
+        else:
+            self._set_label(self._status_note, "Calibration complete.")
+            self._set_status_chip("ready")
 
         logger.info(f"Calibration complete with threshold: {threshold:.3f}")
 
+    @pyqtSlot(str)
+    def on_calibration_failed(self, reason: str) -> None:
+        """Handle calibration ending without a threshold.
+
+        Args:
+            reason: Why the vision worker abandoned calibration.
+        """
+        if not self._calibrating:
+            # Monitoring stop already reset the controls
+            return
+        self._calibrating = False
+        self._progress_timer.stop()
+        if self._calibration_progress is not None:
+            self._calibration_progress.setVisible(False)
+        self._start_button.setEnabled(True)
+        self._calibrate_button.setEnabled(self._monitoring)
+        if self._monitoring:
+            self._set_label(self._status_note, f"Calibration failed: {reason}. Monitoring in progress")
+            self._set_status_chip("monitoring")
+        else:
+            self._set_label(self._status_note, f"Calibration failed: {reason}.")
+            self._set_status_chip("idle")
+
+        logger.warning(f"Calibration failed: {reason}")
+
     @pyqtSlot(bool)
     def set_monitoring_state(self, monitoring: bool) -> None:
         """Set monitoring state from external source.
@@ -723,25 +1232,36 @@ class MainWindow(QMainWindow):
         return self._calibrating
 
     def show_preview(self, frame) -> None:
-        """Update camera preview with incoming frame."""
+        """Hand an incoming frame to the preview converter thread.
+
+        Args:
+            frame: Small BGR frame, or None to clear the preview.
+        """
+        # Nothing to show while hidden to tray or minimized; skip the resample entirely
+        if not self.isVisible() or self.isMinimized():
+            return
+        if frame is None:
+            self._preview_label.clear()
+            self._preview_label.setText("No camera frame")
+            return
+        # Only display when preview is enabled or monitoring is active
+        if self._preview_enabled or self._monitoring:
+            self.preview_requested.emit(frame)
+
+    @pyqtSlot(object)
+    def set_preview_image(self, image: QImage) -> None:
+        """Show a display-sized image produced by the preview converter.
+
+        Args:
+            image: QImage already fitted to the preview box.
+        """
+        # State may have changed while the frame was in flight
+        if not (self._preview_enabled or self._monitoring) or not self.isVisible():
+            return
         try:
-            if frame is None:
-                self._preview_label.clear()
-                self._preview_label.setText("No camera frame")
-                return
-            rgb = frame[:, :, ::-1].copy()  # make contiguous RGB copy
-            h, w, _ = rgb.shape
-            bytes_per_line = 3 * w
-            qimg = QImage(rgb.tobytes(), w, h, bytes_per_line, QImage.Format.Format_RGB888)
-            pix = QPixmap.fromImage(qimg).scaled(
-                480,
-                270,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            # Only display when preview is enabled or monitoring is active
-            if self._preview_enabled or self._monitoring:
-                self._preview_label.setPixmap(pix)
-                self._preview_label.setText("")
+            # One long-lived pixmap handle; convertFromImage refills it in place
+            self._preview_pixmap.convertFromImage(image)
+            self._preview_label.setPixmap(self._preview_pixmap)
+            self._preview_label.setText("")
         except Exception as exc:
             logger.debug(f"Preview update failed: {exc}")
@@ -1,11 +1,20 @@
 """Full-screen overlay animations for Blink! alerts."""
 
+import weakref
 from enum import Enum
-from typing import Literal
+from random import randint
 
 from loguru import logger
-from PyQt6.QtCore import QPointF, QEasingCurve, QPropertyAnimation, QRect, Qt, QTimer, pyqtProperty
+from PyQt6.QtCore import (
+    QEasingCurve,
+    QPointF,
+    QRect,
+    Qt,
+    QTimer,
+    QVariantAnimation,
+)
 from PyQt6.QtGui import (
+    QBrush,
     QColor,
     QFont,
     QLinearGradient,
@@ -13,10 +22,22 @@ from PyQt6.QtGui import (
     QPainterPath,
     QPen,
     QRadialGradient,
-    QScreen,
 )
 from PyQt6.QtWidgets import QApplication, QWidget
 
+# Paint colors; animated alphas index a per-alpha table instead of allocating per frame
+_VIGNETTE_COLORS = tuple(QColor(12, 16, 30, alpha) for alpha in range(81))
+_EDGE_COLORS = tuple(QColor(255, 82, 82, alpha) for alpha in range(141))
+_RING_COLORS = tuple(QColor(94, 234, 212, alpha) for alpha in range(121))
+_CARD_TOP_COLOR = QColor(18, 27, 52, 240)
+_CARD_BOTTOM_COLOR = QColor(20, 30, 58, 225)
+_CARD_OUTLINE_COLOR = QColor(255, 255, 255, 35)
+_EYE_PEN = QPen(QColor(180, 208, 255, 210), 2.4)
+_IRIS_COLOR = QColor(125, 211, 252, 230)
+_LID_COLOR = QColor(25, 35, 54, 235)
+_TITLE_COLOR = QColor(255, 255, 255, 235)
+_BODY_COLOR = QColor(226, 232, 240, 210)
+
 
 class AnimationIntensity(str, Enum):
     """Animation intensity levels."""
@@ -34,6 +55,64 @@ class AnimationMode(str, Enum):
     POPUP = "popup"
 
 
+# Per-intensity tuning, indexed LOW=0, MEDIUM=1, HIGH=2
+_INTENSITY_INDEX = {
+    AnimationIntensity.LOW: 0,
+    AnimationIntensity.MEDIUM: 1,
+    AnimationIntensity.HIGH: 2,
+}
+_BLINK_CYCLES = (3, 4, 5)
+_BLINK_TIMINGS = ((200, 90, 200), (180, 90, 180), (150, 80, 150))
+_BLINK_INTERVALS = (400, 300, 250)
+_BLINK_DIM_LEVELS = (0.86, 0.82, 0.78)
+_IRRITATION_DURATIONS = (1400, 1700, 2000)
+_IRRITATION_STRENGTHS = ((3, 0.2), (5, 0.3), (7, 0.4))
+# Card jitter step during irritation, and the widest jitter any intensity uses
+_SHAKE_STEP_MS = 50
+_SHAKE_MAX_PX = max(strength for strength, _ in _IRRITATION_STRENGTHS)
+
+# Internal mode ids compared on every tick; AnimationMode is only used at the public API
+_MODE_NONE = 0
+_MODE_BLINK = 1
+_MODE_IRRITATION = 2
+_MODE_POPUP = 3
+_MODES = (None, AnimationMode.BLINK, AnimationMode.IRRITATION, AnimationMode.POPUP)
+# Card (title, subtitle) per mode id
+_CARD_TEXTS = (
+    ("Blink break", "Close both eyes twice and stare at something 20 feet away."),
+    ("Blink break", "Close both eyes twice and stare at something 20 feet away."),
+    ("Eyes need a pause", "Look away 20 seconds and blink a few times to refresh."),
+    ("Quick blink", "Blink 2–3 times now to keep your eyes comfortable."),
+)
+
+
+def _clamp_unit(value: float) -> float:
+    """Clamp an animated level to 0.0-1.0 (comparisons only; runs every animation tick)."""
+    if value <= 0.0:
+        return 0.0
+    if value >= 1.0:
+        return 1.0
+    return value
+
+
+def _vignette_alpha(opacity: float) -> int:
+    """Backdrop dim alpha (0-80) drawn for an overlay opacity."""
+    return int(80 * _clamp_unit(1.0 - opacity))
+
+
+def _edge_alpha(tint: float) -> int:
+    """Irritation edge glow alpha (0-140) drawn for a red tint level."""
+    return int(140 * tint)
+
+
+def _in_out_quad(progress: float) -> float:
+    """Quadratic ease-in/out (matches QEasingCurve.InOutQuad) for 0.0-1.0 progress."""
+    if progress < 0.5:
+        return 2.0 * progress * progress
+    inverse = 2.0 - 2.0 * progress
+    return 1.0 - inverse * inverse / 2.0
+
+
 class ScreenOverlay(QWidget):
     """Frameless full-screen overlay for animations."""
 
@@ -42,8 +121,15 @@ class ScreenOverlay(QWidget):
     _blink_level = 0.0
     _pulse_level = 0.0
     _card_only = False
-    _shake_offset_x = 0
-    _shake_offset_y = 0
+    # Card offset while shaking; applied with painter.translate, never by moving the window
+    _shake_dx = 0
+    _shake_dy = 0
+    # A fullscreen update() is queued and not yet painted
+    _repaint_pending = False
+
+    # Primary screen work area shared by every overlay; refreshed on primaryScreenChanged
+    _cached_geo: QRect | None = None
+    _instances: "weakref.WeakSet[ScreenOverlay]" = weakref.WeakSet()
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -58,155 +144,213 @@ class ScreenOverlay(QWidget):
             | Qt.WindowType.NoDropShadowWindowHint
         )
 
+        # Gradient brushes keyed by (kind, alpha); gradients depend on geometry, so resize clears
+        self._brush_cache: dict[tuple[str, int], QBrush] = {}
+
         self._setup_geometry()
         self._setup_animations()
         self._setup_timers()
 
-        self._current_mode: AnimationMode | None = None
+        self._mode = _MODE_NONE
         self._intensity = AnimationIntensity.MEDIUM
+        self._intensity_idx = _INTENSITY_INDEX[self._intensity]
         self._animation_active = False
-        self._blink_count = 0
         self._irritation_ended = False
         self._card_only = False
 
+        self._title_font = QFont()
+        self._title_font.setPointSize(13)
+        self._title_font.setBold(True)
+        self._body_font = QFont()
+        self._body_font.setPointSize(10)
+
         self.setStyleSheet("background: transparent;")
 
     def _setup_geometry(self):
         """Setup fullscreen geometry."""
-        screen = QApplication.primaryScreen()
-        geo = screen.availableGeometry()
-        self.setGeometry(geo)
+        cls = type(self)
+        if cls._cached_geo is None:
+            cls._cached_geo = QApplication.primaryScreen().availableGeometry()
+            QApplication.instance().primaryScreenChanged.connect(cls._on_primary_screen_changed)
+        cls._instances.add(self)
+        self.setGeometry(cls._cached_geo)
+
+    @classmethod
+    def _on_primary_screen_changed(cls, screen):
+        """Re-read the work area and resize every live overlay.
+
+        Args:
+            screen: New primary QScreen.
+        """
+        cls._cached_geo = screen.availableGeometry()
+        for overlay in list(cls._instances):
+            overlay.setGeometry(cls._cached_geo)
 
     def _setup_animations(self):
         """Setup animation objects."""
-        self._opacity_anim = QPropertyAnimation(self, b"opacity")
-        self._opacity_anim.setDuration(300)
-        self._opacity_anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
-
-        self._tint_anim = QPropertyAnimation(self, b"redTint")
+        # Whole blink run as one linear clock in ms; eyelid and dim are derived per tick
+        self._blink_run = QVariantAnimation(self)
+        self._blink_run.setStartValue(0.0)
+        self._blink_run.valueChanged.connect(self._on_blink_tick)
+        self._blink_run.finished.connect(self.stop_animation)
+        # (fade_out, hold, fade_in, cycle length, dim level or None) of the current run
+        self._blink_plan: tuple[int, int, int, int, float | None] = (0, 0, 0, 1, None)
+
+        # Value animations feed bound setters directly; no meta-object property lookup per tick
+        self._tint_anim = QVariantAnimation(self)
         self._tint_anim.setDuration(500)
         self._tint_anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
+        self._tint_anim.valueChanged.connect(self._set_red_tint)
+        self._tint_anim.finished.connect(self._on_tint_finished)
 
-        self._blink_anim = QPropertyAnimation(self, b"blinkLevel")
-        self._blink_anim.setDuration(200)
-        self._blink_anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
-
-        self._pulse_anim = QPropertyAnimation(self, b"pulseLevel")
+        self._pulse_anim = QVariantAnimation(self)
+        self._pulse_anim.valueChanged.connect(self._set_pulse_level)
         self._pulse_anim.setDuration(1200)
         self._pulse_anim.setStartValue(0.0)
         self._pulse_anim.setEndValue(1.0)
         self._pulse_anim.setLoopCount(-1)
         self._pulse_anim.setEasingCurve(QEasingCurve.Type.InOutSine)
 
-        # Shake animation disabled for stability in sandboxed environments
-        self._shake_anim = None
-
     def _setup_timers(self):
         """Setup animation timers."""
-        self._blink_timer = QTimer(self)
-        self._blink_timer.setSingleShot(True)
-        self._blink_timer.timeout.connect(self._next_blink)
-
         self._irritation_timer = QTimer(self)
         self._irritation_timer.setSingleShot(True)
         self._irritation_timer.timeout.connect(self._end_irritation)
 
-    @pyqtProperty(float)
-    def opacity(self) -> float:
-        """Current opacity value."""
-        return self._opacity
+        self._shake_timer = QTimer(self)
+        self._shake_timer.setInterval(_SHAKE_STEP_MS)
+        self._shake_timer.timeout.connect(self._shake_step)
 
-    @opacity.setter
-    def opacity(self, value: float):
+    def _set_opacity(self, value: float):
+        """Set backdrop opacity (1.0 means no dim)."""
+        previous = _vignette_alpha(self._opacity)
         self._opacity = value
-        self.update()
-
-    @pyqtProperty(float)
-    def redTint(self) -> float:
-        """Current red tint value (0.0-1.0)."""
-        return self._red_tint
-
-    @redTint.setter
-    def redTint(self, value: float):
-        self._red_tint = max(0.0, min(1.0, value))
-        self.update()
-
-    @pyqtProperty(object)
-    def shakeOffset(self) -> tuple[int, int]:
-        """Current shake offset as (x, y) tuple."""
-        return (self._shake_offset_x, self._shake_offset_y)
-
-    @shakeOffset.setter
-    def shakeOffset(self, value: tuple[int, int]):
-        self._shake_offset_x, self._shake_offset_y = value
-        self.move(self.pos().x() - self._shake_offset_x, self.pos().y() - self._shake_offset_y)
-
-    @pyqtProperty(float)
-    def blinkLevel(self) -> float:
-        """How closed the stylized eyelid is (0 open, 1 closed)."""
-        return self._blink_level
-
-    @blinkLevel.setter
-    def blinkLevel(self, value: float):
-        self._blink_level = max(0.0, min(1.0, value))
-        self.update()
-
-    @pyqtProperty(float)
-    def pulseLevel(self) -> float:
-        """Soft breathing/pulse intensity (0-1)."""
-        return self._pulse_level
-
-    @pulseLevel.setter
-    def pulseLevel(self, value: float):
-        self._pulse_level = max(0.0, min(1.0, value))
-        self.update()
+        # Only the backdrop reads opacity; steps that land on the same alpha draw nothing new
+        if _vignette_alpha(value) != previous:
+            self._schedule_repaint()
+
+    def _set_red_tint(self, value: float):
+        """Set the irritation edge glow strength (0.0-1.0)."""
+        previous = _edge_alpha(self._red_tint)
+        self._red_tint = _clamp_unit(value)
+        if _edge_alpha(self._red_tint) != previous:
+            self._schedule_repaint()
+
+    def _set_blink_level(self, value: float):
+        """Set how closed the stylized eyelid is (0 open, 1 closed)."""
+        self._blink_level = _clamp_unit(value)
+        # The eyelid lives on the card; the backdrop does not depend on it
+        self._schedule_repaint(self._card_damage_rect())
+
+    def _set_pulse_level(self, value: float):
+        """Set the soft breathing/pulse intensity (0-1)."""
+        self._pulse_level = _clamp_unit(value)
+        self._schedule_repaint(self._card_damage_rect())
+
+    def _schedule_repaint(self, rect: QRect | None = None):
+        """Queue a repaint unless a fullscreen one is already pending.
+
+        Args:
+            rect: Area to invalidate; None for the whole overlay.
+        """
+        # Animations tick together; every step before the next paint folds into one
+        if self._repaint_pending:
+            return
+        if rect is None:
+            self._repaint_pending = True
+            self.update()
+        else:
+            self.update(rect)
+
+    def _card_rect(self) -> QRect:
+        """Geometry of the prompt card near the top of the screen."""
+        width = self.width()
+        card_width = min(int(width * 0.48), 520)
+        return QRect(int((width - card_width) / 2), int(self.height() * 0.08), card_width, 128)
+
+    def _card_damage_rect(self) -> QRect:
+        """Card geometry padded for its antialiased outline and any shake offset."""
+        pad = 2 + _SHAKE_MAX_PX
+        return self._card_rect().adjusted(-pad, -pad, pad, pad)
+
+    def resizeEvent(self, event):
+        """Drop gradient brushes built for the previous geometry."""
+        super().resizeEvent(event)
+        self._brush_cache.clear()
+
+    def _vignette_brush(self, alpha: int) -> QBrush:
+        """Radial backdrop dim centred on the screen, cached per alpha."""
+        key = ("vignette", alpha)
+        brush = self._brush_cache.get(key)
+        if brush is None:
+            radius = max(self.width(), self.height()) * 0.75
+            vignette = QRadialGradient(QPointF(self.rect().center()), radius)
+            vignette.setColorAt(0.0, _VIGNETTE_COLORS[alpha])
+            vignette.setColorAt(1.0, _VIGNETTE_COLORS[0])
+            brush = self._brush_cache[key] = QBrush(vignette)
+        return brush
+
+    def _edge_brush(self, alpha: int) -> QBrush:
+        """Horizontal red glow for irritation mode, cached per alpha."""
+        key = ("edge", alpha)
+        brush = self._brush_cache.get(key)
+        if brush is None:
+            edge = QLinearGradient(0, 0, self.width(), 0)
+            edge.setColorAt(0.0, _EDGE_COLORS[0])
+            edge.setColorAt(0.5, _EDGE_COLORS[alpha])
+            edge.setColorAt(1.0, _EDGE_COLORS[0])
+            brush = self._brush_cache[key] = QBrush(edge)
+        return brush
+
+    def _card_brush(self, card_rect: QRect) -> QBrush:
+        """Vertical card background gradient, built once per geometry."""
+        key = ("card", 0)
+        brush = self._brush_cache.get(key)
+        if brush is None:
+            card_bg = QLinearGradient(
+                QPointF(card_rect.left(), card_rect.top()),
+                QPointF(card_rect.left(), card_rect.bottom()),
+            )
+            # Slightly brighter for visibility
+            card_bg.setColorAt(0.0, _CARD_TOP_COLOR)
+            card_bg.setColorAt(1.0, _CARD_BOTTOM_COLOR)
+            brush = self._brush_cache[key] = QBrush(card_bg)
+        return brush
 
     def paintEvent(self, event):
         """Paint overlay with current opacity and tint."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
+        self._repaint_pending = False
+        # Nothing to draw once an animation ends; skip the painter begin/end entirely
         if not self._animation_active:
             return
 
-        width = self.width()
-        height = self.height()
+        painter = QPainter(self)
+        # Only the invalidated area needs filling; card-only updates skip the fullscreen pass
+        dirty = event.rect()
 
         show_backdrop = not self._card_only
 
-        # Gentle vignette that never blocks content
-        backdrop_strength = max(0.0, 1.0 - self._opacity)
-        if show_backdrop and backdrop_strength > 0:
-            center_point = self.rect().center()
-            vignette = QRadialGradient(QPointF(center_point), max(width, height) * 0.75)
-            vignette.setColorAt(0.0, QColor(12, 16, 30, int(80 * backdrop_strength)))
-            vignette.setColorAt(1.0, QColor(12, 16, 30, 0))
-            painter.fillRect(self.rect(), vignette)
+        # Gentle vignette that never blocks content; fade tails that round to a
+        # transparent alpha skip the fullscreen blend
+        vignette_alpha = _vignette_alpha(self._opacity)
+        if show_backdrop and vignette_alpha > 0:
+            painter.fillRect(dirty, self._vignette_brush(vignette_alpha))
 
         # Soft red edge glow for irritation mode only; fades gently
-        if show_backdrop and self._current_mode == AnimationMode.IRRITATION and self._red_tint > 0:
-            tint_alpha = int(140 * self._red_tint)
-            edge = QLinearGradient(0, 0, width, 0)
-            edge.setColorAt(0.0, QColor(255, 82, 82, 0))
-            edge.setColorAt(0.5, QColor(255, 82, 82, tint_alpha))
-            edge.setColorAt(1.0, QColor(255, 82, 82, 0))
-            painter.fillRect(self.rect(), edge)
+        edge_alpha = _edge_alpha(self._red_tint)
+        if show_backdrop and self._mode == _MODE_IRRITATION and edge_alpha > 0:
+            painter.fillRect(dirty, self._edge_brush(edge_alpha))
 
-        # Card-style prompt near the top of the screen
-        card_width = min(int(width * 0.48), 520)
-        card_height = 128
-        card_rect = QRect(int((width - card_width) / 2), int(height * 0.08), card_width, card_height)
+        # Backdrop fills above are axis-aligned; only the card's curves need antialiasing
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if self._shake_dx or self._shake_dy:
+            painter.translate(self._shake_dx, self._shake_dy)
 
-        card_bg = QLinearGradient(
-            QPointF(card_rect.left(), card_rect.top()),
-            QPointF(card_rect.left(), card_rect.bottom()),
-        )
-        # Slightly brighter for visibility
-        card_bg.setColorAt(0.0, QColor(18, 27, 52, 240))
-        card_bg.setColorAt(1.0, QColor(20, 30, 58, 225))
+        # Card-style prompt near the top of the screen
+        card_rect = self._card_rect()
 
-        painter.setPen(QColor(255, 255, 255, 35))
-        painter.setBrush(card_bg)
+        painter.setPen(_CARD_OUTLINE_COLOR)
+        painter.setBrush(self._card_brush(card_rect))
         painter.drawRoundedRect(card_rect, 16, 16)
 
         # Eye graphic on the left
@@ -223,14 +367,14 @@ class ScreenOverlay(QWidget):
             eye_height,
         )
 
-        painter.setPen(QPen(QColor(180, 208, 255, 210), 2.4))
+        painter.setPen(_EYE_PEN)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawEllipse(eye_rect)
 
         # Iris
         iris_radius = int((eye_height * 0.30) * (0.8 + 0.2 * self._pulse_level))
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(125, 211, 252, 230))
+        painter.setBrush(_IRIS_COLOR)
         painter.drawEllipse(
             eye_rect.center().x() - iris_radius,
             eye_rect.center().y() - iris_radius,
@@ -254,37 +398,22 @@ class ScreenOverlay(QWidget):
             lid_path.quadTo(eye_rect.center().x(), lid_curve_y + eye_height * 0.45, eye_rect.left() + 6, lid_close_y)
             lid_path.closeSubpath()
 
-            lid_color = QColor(25, 35, 54, 235)
-            painter.setBrush(lid_color)
+            painter.setBrush(_LID_COLOR)
             painter.setPen(Qt.PenStyle.NoPen)
             painter.drawPath(lid_path)
 
         # Glow ring pulse
         ring_alpha = int(120 * (0.2 + 0.8 * (1 - self._blink_level)) * (0.4 + 0.6 * self._pulse_level))
-        painter.setPen(QPen(QColor(94, 234, 212, ring_alpha), 3.2))
+        painter.setPen(QPen(_RING_COLORS[ring_alpha], 3.2))
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawEllipse(eye_rect.adjusted(-6, -6, 6, 6))
 
         # Text block on the right
         text_left = card_rect.left() + eye_width + inset
-        title_font = QFont()
-        title_font.setPointSize(13)
-        title_font.setBold(True)
-
-        body_font = QFont()
-        body_font.setPointSize(10)
+        painter.setPen(_TITLE_COLOR)
+        painter.setFont(self._title_font)
 
-        painter.setPen(QColor(255, 255, 255, 235))
-        painter.setFont(title_font)
-
-        title = "Blink break"
-        subtitle = "Close both eyes twice and stare at something 20 feet away."
-        if self._current_mode == AnimationMode.IRRITATION:
-            title = "Eyes need a pause"
-            subtitle = "Look away 20 seconds and blink a few times to refresh."
-        elif self._current_mode == AnimationMode.POPUP:
-            title = "Quick blink"
-            subtitle = "Blink 2–3 times now to keep your eyes comfortable."
+        title, subtitle = _CARD_TEXTS[self._mode]
 
         painter.drawText(
             QRect(text_left, card_rect.top() + inset + 2, card_rect.width() - eye_width - inset * 2, 26),
@@ -292,8 +421,8 @@ class ScreenOverlay(QWidget):
             title,
         )
 
-        painter.setPen(QColor(226, 232, 240, 210))
-        painter.setFont(body_font)
+        painter.setPen(_BODY_COLOR)
+        painter.setFont(self._body_font)
         painter.drawText(
             QRect(
                 text_left,
@@ -312,6 +441,7 @@ class ScreenOverlay(QWidget):
             intensity: Intensity level (low/medium/high).
         """
         self._intensity = intensity
+        self._intensity_idx = _INTENSITY_INDEX[intensity]
         logger.debug(f"Animation intensity set to {intensity}")
 
     def play_blink(self):
@@ -319,16 +449,15 @@ class ScreenOverlay(QWidget):
         if self._animation_active:
             self.stop_animation()
 
-        self._current_mode = AnimationMode.BLINK
+        self._mode = _MODE_BLINK
         self._animation_active = True
-        self._blink_count = 0
         self._irritation_ended = False
         self._card_only = False
 
         self.show()
         self._pulse_anim.stop()
         self._pulse_anim.start()
-        self._next_blink()
+        self._start_blink_sequence()
         logger.debug("Blink animation started")
 
     def play_irritation(self):
@@ -336,7 +465,7 @@ class ScreenOverlay(QWidget):
         if self._animation_active:
             self.stop_animation()
 
-        self._current_mode = AnimationMode.IRRITATION
+        self._mode = _MODE_IRRITATION
         self._animation_active = True
         self._irritation_ended = False
         self._card_only = False
@@ -352,9 +481,8 @@ class ScreenOverlay(QWidget):
         if self._animation_active:
             self.stop_animation()
 
-        self._current_mode = AnimationMode.POPUP
+        self._mode = _MODE_POPUP
         self._animation_active = True
-        self._blink_count = 0
         self._card_only = True
         self._irritation_ended = False
 
@@ -362,65 +490,55 @@ class ScreenOverlay(QWidget):
         self.show()
         self._pulse_anim.stop()
         self._pulse_anim.start()
-        self._next_blink()
+        self._start_blink_sequence()
         logger.debug("Popup animation started")
 
-    def _next_blink(self):
-        """Play next blink cycle."""
-        if not self._animation_active or self._current_mode not in (AnimationMode.BLINK, AnimationMode.POPUP):
-            return
-
-        if self._blink_count >= self._get_blink_cycles():
-            self.stop_animation()
-            return
-
-        self._blink_count += 1
+    def _start_blink_sequence(self):
+        """Plan every blink cycle for the current mode and run them on a single animation."""
+        self._blink_run.stop()
 
         fade_out, hold, fade_in = self._get_blink_timings()
+        cycle = fade_out + hold + fade_in + self._get_blink_interval()
+        # Popup keeps the screen undimmed; only the eyelid moves
+        dim = None if self._card_only else self._get_blink_dim_level()
+        self._blink_plan = (fade_out, hold, fade_in, cycle, dim)
 
-        do_dim = not self._card_only
-        if do_dim:
-            self._opacity_anim.stop()
-            self._opacity_anim.setDuration(fade_out)
-            self._opacity_anim.setStartValue(self._opacity)
-            self._opacity_anim.setEndValue(self._get_blink_dim_level())
-            self._opacity_anim.start()
-        else:
-            self._opacity = 1.0
-
-        self._blink_anim.stop()
-        self._blink_anim.setDuration(fade_out)
-        self._blink_anim.setStartValue(self._blink_level)
-        self._blink_anim.setEndValue(1.0)
-        self._blink_anim.start()
+        total = cycle * self._get_blink_cycles()
+        self._blink_run.setDuration(total)
+        self._blink_run.setEndValue(float(total))
+        self._blink_run.start()
 
-        QTimer.singleShot(fade_out + hold, lambda: self._start_blink_open(fade_in))
+    def _on_blink_tick(self, elapsed: float):
+        """Derive eyelid and backdrop levels for a point in the blink run.
 
-    def _start_blink_open(self, duration: int):
-        """Re-open eyelid and schedule next gentle blink."""
-        if not self._animation_active:
-            return
+        Each cycle closes the lid (dimming), holds, reopens it and rests; both
+        transitions ease in/out.
 
-        if not self._card_only:
-            self._opacity_anim.stop()
-            self._opacity_anim.setDuration(duration)
-            self._opacity_anim.setStartValue(self._opacity)
-            self._opacity_anim.setEndValue(1.0)
-            self._opacity_anim.start()
+        Args:
+            elapsed: Milliseconds since the run started.
+        """
+        fade_out, hold, fade_in, cycle, dim = self._blink_plan
+        t = elapsed % cycle if elapsed < self._blink_run.duration() else cycle
+        if t < fade_out:
+            closed = _in_out_quad(t / fade_out)
+        elif t < fade_out + hold:
+            closed = 1.0
+        elif t < fade_out + hold + fade_in:
+            closed = 1.0 - _in_out_quad((t - fade_out - hold) / fade_in)
         else:
-            self._opacity = 1.0
-
-        self._blink_anim.stop()
-        self._blink_anim.setDuration(duration)
-        self._blink_anim.setStartValue(self._blink_level)
-        self._blink_anim.setEndValue(0.0)
-        self._blink_anim.start()
+            closed = 0.0
 
-        QTimer.singleShot(duration, lambda: self._blink_timer.start(self._get_blink_interval()))
+        # Holds and rests repeat the same levels; skip their repaints
+        if closed != self._blink_level:
+            self._set_blink_level(closed)
+        if dim is not None:
+            opacity = 1.0 + (dim - 1.0) * closed
+            if opacity != self._opacity:
+                self._set_opacity(opacity)
 
     def _start_irritation(self):
         """Start irritation animation."""
-        shake_strength, tint_strength = self._get_irritation_strength()
+        tint_strength = self._get_irritation_strength()[1]
 
         self._tint_anim.stop()
         self._tint_anim.setDuration(500)
@@ -428,45 +546,28 @@ class ScreenOverlay(QWidget):
         self._tint_anim.setEndValue(tint_strength)
         self._tint_anim.start()
 
-        self._start_shake_sequence()
+        self._shake_timer.start()
 
         duration = self._get_irritation_duration()
         self._irritation_timer.start(duration)
 
-    def _start_shake_sequence(self):
-        """Start screen shake sequence."""
-        if not self._animation_active or self._current_mode != AnimationMode.IRRITATION:
-            return
-
-        if self._shake_anim is None:
-            logger.debug("Shake animation skipped (not available)")
+    def _shake_step(self):
+        """Jitter the card to a new random offset until irritation ends."""
+        if not self._animation_active or self._mode != _MODE_IRRITATION or self._irritation_ended:
+            self._shake_timer.stop()
+            self._shake_dx = self._shake_dy = 0
+            self._schedule_repaint(self._card_damage_rect())
             return
 
         shake_strength = self._get_irritation_strength()[0]
-
-        self._shake_anim.stop()
-        self._shake_anim.setDuration(50)
-
-        import random
-
-        offset_x = random.randint(-shake_strength, shake_strength)
-        offset_y = random.randint(-shake_strength, shake_strength)
-
-        self._shake_anim.setStartValue((self._shake_offset_x, self._shake_offset_y))
-        self._shake_anim.setEndValue((offset_x, offset_y))
-        self._shake_anim.start()
-
-    def _on_shake_step(self):
-        """Handle shake animation step completion."""
-        if not self._animation_active or self._current_mode != AnimationMode.IRRITATION:
-            return
-
-        if not self._irritation_ended:
-            QTimer.singleShot(50, self._start_shake_sequence)
+        self._shake_dx = randint(-shake_strength, shake_strength)
+        self._shake_dy = randint(-shake_strength, shake_strength)
+        # Only the card moves, so only its (padded) area is repainted
+        self._schedule_repaint(self._card_damage_rect())
 
     def _end_irritation(self):
         """End irritation animation smoothly."""
-        if not self._animation_active or self._current_mode != AnimationMode.IRRITATION:
+        if not self._animation_active or self._mode != _MODE_IRRITATION:
             return
 
         self._irritation_ended = True
@@ -475,9 +576,13 @@ class ScreenOverlay(QWidget):
         self._tint_anim.setDuration(300)
         self._tint_anim.setStartValue(self._red_tint)
         self._tint_anim.setEndValue(0.0)
-        self._tint_anim.finished.connect(lambda: self.stop_animation())
         self._tint_anim.start()
 
+    def _on_tint_finished(self):
+        """Close the overlay once the irritation tint has faded out."""
+        if self._irritation_ended:
+            self.stop_animation()
+
     def stop_animation(self):
         """Stop current animation and hide overlay."""
         if not self._animation_active:
@@ -486,78 +591,53 @@ class ScreenOverlay(QWidget):
         logger.debug("Animation stopped")
 
         self._animation_active = False
-        self._blink_timer.stop()
         self._irritation_timer.stop()
-        self._opacity_anim.stop()
+        self._blink_run.stop()
         self._tint_anim.stop()
-        self._blink_anim.stop()
         self._pulse_anim.stop()
-        if self._shake_anim:
-            self._shake_anim.stop()
+        self._shake_timer.stop()
 
         self._opacity = 1.0
         self._red_tint = 0.0
         self._blink_level = 0.0
         self._pulse_level = 0.0
         self._card_only = False
-        self._shake_offset_x = 0
-        self._shake_offset_y = 0
+        self._shake_dx = 0
+        self._shake_dy = 0
 
         self.hide()
 
     def _get_blink_cycles(self) -> int:
         """Get number of blink cycles based on intensity."""
-        base = {AnimationIntensity.LOW: 3, AnimationIntensity.MEDIUM: 4, AnimationIntensity.HIGH: 5}[
-            self._intensity
-        ]
         # Popup stays brief by design
         if self._card_only:
             return 3
-        return base
+        return _BLINK_CYCLES[self._intensity_idx]
 
     def _get_blink_timings(self) -> tuple[int, int, int]:
         """Get blink timing tuple (fade_out, hold, fade_in) in ms."""
         if self._card_only:
             return 160, 80, 160
-        if self._intensity == AnimationIntensity.LOW:
-            return 200, 90, 200
-        elif self._intensity == AnimationIntensity.MEDIUM:
-            return 180, 90, 180
-        else:
-            return 150, 80, 150
+        return _BLINK_TIMINGS[self._intensity_idx]
 
     def _get_blink_interval(self) -> int:
         """Get interval between blinks in ms."""
-        return {AnimationIntensity.LOW: 400, AnimationIntensity.MEDIUM: 300, AnimationIntensity.HIGH: 250}[
-            self._intensity
-        ]
+        return _BLINK_INTERVALS[self._intensity_idx]
 
     def _get_blink_dim_level(self) -> float:
         """Get dim level for blink (0.0-1.0)."""
         # Keep screen visible; gentle dim instead of black flash
         if self._card_only:
             return 1.0
-        return {
-            AnimationIntensity.LOW: 0.86,
-            AnimationIntensity.MEDIUM: 0.82,
-            AnimationIntensity.HIGH: 0.78,
-        }[self._intensity]
+        return _BLINK_DIM_LEVELS[self._intensity_idx]
 
     def _get_irritation_duration(self) -> int:
         """Get total duration of irritation in ms."""
-        return {
-            AnimationIntensity.LOW: 1400,
-            AnimationIntensity.MEDIUM: 1700,
-            AnimationIntensity.HIGH: 2000,
-        }[self._intensity]
+        return _IRRITATION_DURATIONS[self._intensity_idx]
 
     def _get_irritation_strength(self) -> tuple[int, float]:
         """Get irritation strength tuple (shake_pixels, tint_level)."""
-        return {
-            AnimationIntensity.LOW: (3, 0.2),
-            AnimationIntensity.MEDIUM: (5, 0.3),
-            AnimationIntensity.HIGH: (7, 0.4),
-        }[self._intensity]
+        return _IRRITATION_STRENGTHS[self._intensity_idx]
 
     def keyPressEvent(self, event):
         """Handle key press events."""
@@ -574,4 +654,4 @@ class ScreenOverlay(QWidget):
     @property
     def current_mode(self) -> AnimationMode | None:
         """Get current animation mode."""
-        return self._current_mode
+        return _MODES[self._mode]
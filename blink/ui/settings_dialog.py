@@ -1,5 +1,7 @@
 """Settings dialog for Blink!."""
 
+from typing import Callable
+
 from loguru import logger
 
 from blink.config.settings import (
@@ -29,6 +31,7 @@ from PyQt6.QtWidgets import (
     QLabel,
     QLineEdit,
     QMessageBox,
+    QPushButton,
     QSpinBox,
     QTabWidget,
     QTimeEdit,
@@ -37,31 +40,93 @@ from PyQt6.QtWidgets import (
 )
 
 
+_DIALOG_QSS = """
+QDialog { background: #0f172a; }
+QLabel { color: #e2e8f0; }
+QLabel#Notice { padding: 12px; background-color: #ecf0f1; border-radius: 8px; }
+QTabWidget::pane { border: 1px solid #1f2c46; border-radius: 10px; padding: 6px; }
+QTabBar::tab { background: #0b1220; color: #cbd5e1; padding: 10px 14px; border: 1px solid #1f2c46; border-bottom: none; border-top-left-radius: 8px; border-top-right-radius: 8px; margin-right: 4px; }
+QTabBar::tab:selected { background: #111a2f; color: #e2e8f0; }
+QGroupBox { border: 1px solid #1f2c46; border-radius: 10px; margin-top: 12px; color: #e2e8f0; }
+QGroupBox:title { subcontrol-origin: margin; left: 10px; padding: 0 6px; }
+QSpinBox, QDoubleSpinBox, QLineEdit, QComboBox, QTimeEdit { background: #0b1220; color: #e2e8f0; border: 1px solid #1f2c46; border-radius: 6px; padding: 6px; }
+QCheckBox { color: #e2e8f0; }
+QPushButton { padding: 10px 16px; border-radius: 8px; background: #0ea5e9; color: #0b1220; font-weight: 700; }
+QPushButton:disabled { background: #1f2c46; color: #7c879e; }
+"""
+
+
 class SettingsDialog(QDialog):
     """Settings configuration dialog."""
 
-    def __init__(self, settings: Settings, parent=None, available_cameras: list[tuple[int, str]] | None = None):
+    def __init__(
+        self,
+        settings: Settings,
+        parent=None,
+        available_cameras: list[tuple[int, str]] | None = None,
+        refresh_cameras: Callable[[], None] | None = None,
+    ):
         super().__init__(parent)
         self.settings = settings
+        # Asks the owner to re-enumerate devices off the GUI thread; the result
+        # comes back through update_cameras()
+        self._refresh_cameras = refresh_cameras
+        self._refresh_button: QPushButton | None = None
         self._temp_settings: Settings = settings.model_copy()
-        self.available_cameras = available_cameras or []
-
-        self.setStyleSheet(
-            """
-            QDialog { background: #0f172a; }
-            QLabel { color: #e2e8f0; }
-            QTabWidget::pane { border: 1px solid #1f2c46; border-radius: 10px; padding: 6px; }
-            QTabBar::tab { background: #0b1220; color: #cbd5e1; padding: 10px 14px; border: 1px solid #1f2c46; border-bottom: none; border-top-left-radius: 8px; border-top-right-radius: 8px; margin-right: 4px; }
-            QTabBar::tab:selected { background: #111a2f; color: #e2e8f0; }
-            QGroupBox { border: 1px solid #1f2c46; border-radius: 10px; margin-top: 12px; color: #e2e8f0; }
-            QGroupBox:title { subcontrol-origin: margin; left: 10px; padding: 0 6px; }
-            QSpinBox, QDoubleSpinBox, QLineEdit, QComboBox, QTimeEdit { background: #0b1220; color: #e2e8f0; border: 1px solid #1f2c46; border-radius: 6px; padding: 6px; }
-            QCheckBox { color: #e2e8f0; }
-            QPushButton { padding: 10px 16px; border-radius: 8px; background: #0ea5e9; color: #0b1220; font-weight: 700; }
-            QPushButton:disabled { background: #1f2c46; color: #7c879e; }
-            """
-        )
+        self.available_cameras: list[tuple[int, str]] = []
+
+        self.setStyleSheet(_DIALOG_QSS)
         self._init_ui()
+        self.load(settings, available_cameras)
+
+    def load(self, settings: Settings, available_cameras: list[tuple[int, str]] | None = None) -> None:
+        """Point the dialog at a settings snapshot and refresh every field in place.
+
+        The widget tree is built once; reopening the dialog only reloads values.
+
+        Args:
+            settings: Settings to edit (copied; the original is untouched until accept).
+            available_cameras: Enumerated ``(id, name)`` camera list.
+        """
+        self.settings = settings
+        self._temp_settings = settings.model_copy()
+        self._set_cameras(available_cameras or [])
+        if self._refresh_button is not None:
+            self._refresh_button.setEnabled(True)
+        self._load_general_values()
+        self._load_detection_values()
+        self._load_animation_values()
+        self._load_privacy_values()
+
+    def _set_cameras(self, available_cameras: list[tuple[int, str]]) -> None:
+        """Rebuild the camera combo items from an enumeration result."""
+        self.available_cameras = available_cameras or [(i, f"Camera {i}") for i in range(0, 3)]
+        self._camera_combo.blockSignals(True)
+        try:
+            self._camera_combo.clear()
+            for cam_id, cam_name in self.available_cameras:
+                self._camera_combo.addItem(cam_name, cam_id)
+        finally:
+            self._camera_combo.blockSignals(False)
+
+    def _on_refresh_cameras(self) -> None:
+        """Request a camera re-enumeration; the button stays disabled until it lands."""
+        self._refresh_button.setEnabled(False)
+        self._refresh_cameras()
+
+    def update_cameras(self, available_cameras: list[tuple[int, str]]) -> None:
+        """Apply a finished camera enumeration, keeping the current pick when it still exists.
+
+        Args:
+            available_cameras: Enumerated ``(id, name)`` camera list.
+        """
+        selected = self._camera_combo.currentData()
+        self._set_cameras(available_cameras)
+        index = self._camera_combo.findData(selected)
+        if index >= 0:
+            self._camera_combo.setCurrentIndex(index)
+        if self._refresh_button is not None:
+            self._refresh_button.setEnabled(True)
 
     def _init_ui(self) -> None:
         """Initialize UI components."""
@@ -91,33 +156,24 @@ class SettingsDialog(QDialog):
         layout = QFormLayout(widget)
 
         self._start_minimized_check = QCheckBox()
-        self._start_minimized_check.setChecked(self._temp_settings.start_minimized)
         layout.addRow("Start minimized:", self._start_minimized_check)
 
         self._tray_icon_check = QCheckBox()
-        self._tray_icon_check.setChecked(self._temp_settings.show_tray_icon)
         layout.addRow("Show tray icon:", self._tray_icon_check)
 
         self._notifications_check = QCheckBox()
-        self._notifications_check.setChecked(self._temp_settings.enable_notifications)
         layout.addRow("Enable notifications:", self._notifications_check)
 
         self._status_panel_check = QCheckBox()
-        self._status_panel_check.setChecked(self._temp_settings.show_status_panel)
         layout.addRow("Show status panel:", self._status_panel_check)
 
         # Quiet hours
         self._quiet_hours_check = QCheckBox("Silence animations during quiet hours")
-        self._quiet_hours_check.setChecked(self._temp_settings.quiet_hours_enabled)
         quiet_box = QHBoxLayout()
         self._quiet_start = QTimeEdit()
         self._quiet_start.setDisplayFormat("HH:mm")
-        start_h, start_m = map(int, self._temp_settings.quiet_hours_start.split(":"))
-        self._quiet_start.setTime(QTime(start_h, start_m))
         self._quiet_end = QTimeEdit()
         self._quiet_end.setDisplayFormat("HH:mm")
-        end_h, end_m = map(int, self._temp_settings.quiet_hours_end.split(":"))
-        self._quiet_end.setTime(QTime(end_h, end_m))
         quiet_box.addWidget(QLabel("From"))
         quiet_box.addWidget(self._quiet_start)
         quiet_box.addWidget(QLabel("to"))
@@ -131,19 +187,34 @@ class SettingsDialog(QDialog):
 
         # Aggregated stats
         self._stats_toggle = QCheckBox("Store daily blink counts + last trigger time (no images/video)")
-        self._stats_toggle.setChecked(self._temp_settings.collect_aggregated_stats)
         layout.addRow("Aggregated stats:", self._stats_toggle)
 
         # Hotkeys
-        self._hotkey_start = QLineEdit(self._temp_settings.hotkey_start_stop)
-        self._hotkey_pause = QLineEdit(self._temp_settings.hotkey_pause)
-        self._hotkey_test = QLineEdit(self._temp_settings.hotkey_test)
+        self._hotkey_start = QLineEdit()
+        self._hotkey_pause = QLineEdit()
+        self._hotkey_test = QLineEdit()
         layout.addRow("Hotkey: start/stop", self._hotkey_start)
         layout.addRow("Hotkey: pause", self._hotkey_pause)
         layout.addRow("Hotkey: test animation", self._hotkey_test)
 
         return widget
 
+    def _load_general_values(self) -> None:
+        s = self._temp_settings
+        self._start_minimized_check.setChecked(s.start_minimized)
+        self._tray_icon_check.setChecked(s.show_tray_icon)
+        self._notifications_check.setChecked(s.enable_notifications)
+        self._status_panel_check.setChecked(s.show_status_panel)
+        self._quiet_hours_check.setChecked(s.quiet_hours_enabled)
+        start_h, start_m = map(int, s.quiet_hours_start.split(":"))
+        self._quiet_start.setTime(QTime(start_h, start_m))
+        end_h, end_m = map(int, s.quiet_hours_end.split(":"))
+        self._quiet_end.setTime(QTime(end_h, end_m))
+        self._stats_toggle.setChecked(s.collect_aggregated_stats)
+        self._hotkey_start.setText(s.hotkey_start_stop)
+        self._hotkey_pause.setText(s.hotkey_pause)
+        self._hotkey_test.setText(s.hotkey_test)
+
     def _create_detection_tab(self) -> QWidget:
         widget = QWidget()
         vbox = QVBoxLayout(widget)
@@ -156,18 +227,11 @@ class SettingsDialog(QDialog):
         self._no_blink_rule_check = QCheckBox("Alert if no blink for N seconds")
         self._low_rate_rule_check = QCheckBox("Alert if blink rate stays low")
 
-        current_logic = self._temp_settings.trigger_logic
-        if isinstance(current_logic, str):
-            current_logic = TriggerLogic(current_logic)
-        self._no_blink_rule_check.setChecked(current_logic in (TriggerLogic.NO_BLINK, TriggerLogic.BOTH))
-        self._low_rate_rule_check.setChecked(current_logic in (TriggerLogic.LOW_RATE, TriggerLogic.BOTH))
-
         trigger_layout.addRow(self._no_blink_rule_check)
 
         self._no_blink_spin = QSpinBox()
         self._no_blink_spin.setRange(5, 120)
         self._no_blink_spin.setSuffix(" seconds")
-        self._no_blink_spin.setValue(self._temp_settings.no_blink_seconds)
         trigger_layout.addRow("No blink for:", self._no_blink_spin)
 
         trigger_layout.addRow(self._low_rate_rule_check)
@@ -175,19 +239,16 @@ class SettingsDialog(QDialog):
         self._low_rate_spin = QSpinBox()
         self._low_rate_spin.setRange(5, 30)
         self._low_rate_spin.setSuffix(" blinks/min")
-        self._low_rate_spin.setValue(self._temp_settings.low_rate_threshold)
         trigger_layout.addRow("Blink rate below:", self._low_rate_spin)
 
         self._low_rate_duration = QSpinBox()
         self._low_rate_duration.setRange(1, 15)
         self._low_rate_duration.setSuffix(" minutes")
-        self._low_rate_duration.setValue(self._temp_settings.low_rate_duration_minutes)
         trigger_layout.addRow("…for at least:", self._low_rate_duration)
 
         self._alert_interval_spin = QSpinBox()
         self._alert_interval_spin.setRange(1, 60)
         self._alert_interval_spin.setSuffix(" minutes")
-        self._alert_interval_spin.setValue(self._temp_settings.alert_interval_minutes)
         trigger_layout.addRow("Cooldown between alerts:", self._alert_interval_spin)
 
         vbox.addWidget(trigger_group)
@@ -199,28 +260,23 @@ class SettingsDialog(QDialog):
         self._ear_threshold_spin.setRange(0.1, 0.4)
         self._ear_threshold_spin.setSingleStep(0.01)
         self._ear_threshold_spin.setDecimals(3)
-        self._ear_threshold_spin.setValue(self._temp_settings.ear_threshold)
         detect_layout.addRow("EAR threshold:", self._ear_threshold_spin)
 
         self._auto_calibrate_check = QCheckBox()
-        self._auto_calibrate_check.setChecked(self._temp_settings.auto_calibrate)
         detect_layout.addRow("Auto-calibrate on start:", self._auto_calibrate_check)
 
         self._blink_frames_spin = QSpinBox()
         self._blink_frames_spin.setRange(1, 5)
-        self._blink_frames_spin.setValue(self._temp_settings.blink_consecutive_frames)
         detect_layout.addRow("Closed frames to count blink:", self._blink_frames_spin)
 
         self._min_blink_spin = QSpinBox()
         self._min_blink_spin.setRange(20, 200)
         self._min_blink_spin.setSuffix(" ms")
-        self._min_blink_spin.setValue(self._temp_settings.min_blink_duration_ms)
         detect_layout.addRow("Min blink duration:", self._min_blink_spin)
 
         self._max_blink_spin = QSpinBox()
         self._max_blink_spin.setRange(200, 1000)
         self._max_blink_spin.setSuffix(" ms")
-        self._max_blink_spin.setValue(self._temp_settings.max_blink_duration_ms)
         detect_layout.addRow("Max blink duration:", self._max_blink_spin)
 
         vbox.addWidget(detect_group)
@@ -230,52 +286,70 @@ class SettingsDialog(QDialog):
 
         # Camera selector
         self._camera_combo = QComboBox()
-        if not self.available_cameras:
-            self.available_cameras = [(i, f"Camera {i}") for i in range(0, 3)]
-        for cam_id, cam_name in self.available_cameras:
-            self._camera_combo.addItem(cam_name, cam_id)
-        current_cam = self._temp_settings.camera_id
-        cam_index = self._camera_combo.findData(current_cam)
-        if cam_index >= 0:
-            self._camera_combo.setCurrentIndex(cam_index)
         camera_layout.addWidget(QLabel("Camera device:"), 0, 0)
         camera_layout.addWidget(self._camera_combo, 0, 1)
+        if self._refresh_cameras is not None:
+            self._refresh_button = QPushButton("Refresh cameras")
+            self._refresh_button.clicked.connect(self._on_refresh_cameras)
+            camera_layout.addWidget(self._refresh_button, 0, 2)
 
         self._resolution_combo = QComboBox()
         self._resolution_combo.addItem("Default (640x480)", CameraResolution.DEFAULT)
         self._resolution_combo.addItem("Eco (320x240)", CameraResolution.ECO)
-        current_res = self._temp_settings.camera_resolution
-        if isinstance(current_res, str):
-            try:
-                current_res = CameraResolution(current_res)
-            except ValueError:
-                current_res = CameraResolution.DEFAULT
-        res_index = self._resolution_combo.findData(current_res)
-        if res_index >= 0:
-            self._resolution_combo.setCurrentIndex(res_index)
         camera_layout.addWidget(QLabel("Resolution:"), 1, 0)
         camera_layout.addWidget(self._resolution_combo, 1, 1)
 
         self._fps_spin = QSpinBox()
         self._fps_spin.setRange(5, 30)
-        self._fps_spin.setValue(self._temp_settings.target_fps)
         camera_layout.addWidget(QLabel("Target FPS:"), 2, 0)
         camera_layout.addWidget(self._fps_spin, 2, 1)
 
         self._camera_id_spin = QSpinBox()
         self._camera_id_spin.setRange(0, 9)
-        self._camera_id_spin.setValue(self._temp_settings.camera_id)
         camera_layout.addWidget(QLabel("Camera ID (fallback):"), 3, 0)
         camera_layout.addWidget(self._camera_id_spin, 3, 1)
 
         self._camera_enabled_check = QCheckBox("Enable camera")
-        self._camera_enabled_check.setChecked(self._temp_settings.camera_enabled)
         camera_layout.addWidget(self._camera_enabled_check, 4, 0, 1, 2)
 
         vbox.addWidget(camera_group)
         vbox.addStretch()
         return widget
 
+    def _load_detection_values(self) -> None:
+        s = self._temp_settings
+        current_logic = s.trigger_logic
+        if isinstance(current_logic, str):
+            current_logic = TriggerLogic(current_logic)
+        self._no_blink_rule_check.setChecked(current_logic in (TriggerLogic.NO_BLINK, TriggerLogic.BOTH))
+        self._low_rate_rule_check.setChecked(current_logic in (TriggerLogic.LOW_RATE, TriggerLogic.BOTH))
+        self._no_blink_spin.setValue(s.no_blink_seconds)
+        self._low_rate_spin.setValue(s.low_rate_threshold)
+        self._low_rate_duration.setValue(s.low_rate_duration_minutes)
+        self._alert_interval_spin.setValue(s.alert_interval_minutes)
+
+        self._ear_threshold_spin.setValue(s.ear_threshold)
+        self._auto_calibrate_check.setChecked(s.auto_calibrate)
+        self._blink_frames_spin.setValue(s.blink_consecutive_frames)
+        self._min_blink_spin.setValue(s.min_blink_duration_ms)
+        self._max_blink_spin.setValue(s.max_blink_duration_ms)
+
+        cam_index = self._camera_combo.findData(s.camera_id)
+        if cam_index >= 0:
+            self._camera_combo.setCurrentIndex(cam_index)
+        current_res = s.camera_resolution
+        if isinstance(current_res, str):
+            try:
+                current_res = CameraResolution(current_res)
+            except ValueError:
+                current_res = CameraResolution.DEFAULT
+        res_index = self._resolution_combo.findData(current_res)
+        if res_index >= 0:
+            self._resolution_combo.setCurrentIndex(res_index)
+        self._fps_spin.setValue(s.target_fps)
+        self._camera_id_spin.setValue(s.camera_id)
+        self._camera_enabled_check.setChecked(s.camera_enabled)
+
     def _create_animations_tab(self) -> QWidget:
         widget = QWidget()
         layout = QFormLayout(widget)
@@ -284,15 +358,6 @@ class SettingsDialog(QDialog):
         self._alert_mode_combo.addItem("Blink animation (gentle)", AlertMode.BLINK)
         self._alert_mode_combo.addItem("Irritation animation (attention)", AlertMode.IRRITATION)
         self._alert_mode_combo.addItem("Popup reminder (card only)", AlertMode.POPUP)
-        current_mode = self._temp_settings.alert_mode
-        if isinstance(current_mode, str):
-            try:
-                current_mode = AlertMode(current_mode)
-            except ValueError:
-                current_mode = AlertMode.BLINK
-        mode_index = self._alert_mode_combo.findData(current_mode)
-        if mode_index >= 0:
-            self._alert_mode_combo.setCurrentIndex(mode_index)
         layout.addRow("Animation mode:", self._alert_mode_combo)
 
         self._animation_intensity_combo = QComboBox()
@@ -302,7 +367,28 @@ class SettingsDialog(QDialog):
             ("High", AnimationIntensity.HIGH),
         ]:
             self._animation_intensity_combo.addItem(label, value)
-        current_intensity = self._temp_settings.animation_intensity
+        layout.addRow("Intensity:", self._animation_intensity_combo)
+
+        self._animation_spin = QSpinBox()
+        self._animation_spin.setRange(500, 5000)
+        self._animation_spin.setSuffix(" ms")
+        layout.addRow("Base animation duration:", self._animation_spin)
+
+        return widget
+
+    def _load_animation_values(self) -> None:
+        s = self._temp_settings
+        current_mode = s.alert_mode
+        if isinstance(current_mode, str):
+            try:
+                current_mode = AlertMode(current_mode)
+            except ValueError:
+                current_mode = AlertMode.BLINK
+        mode_index = self._alert_mode_combo.findData(current_mode)
+        if mode_index >= 0:
+            self._alert_mode_combo.setCurrentIndex(mode_index)
+
+        current_intensity = s.animation_intensity
         if isinstance(current_intensity, str):
             try:
                 current_intensity = AnimationIntensity(current_intensity)
@@ -311,15 +397,8 @@ class SettingsDialog(QDialog):
         intensity_index = self._animation_intensity_combo.findData(current_intensity)
         if intensity_index >= 0:
             self._animation_intensity_combo.setCurrentIndex(intensity_index)
-        layout.addRow("Intensity:", self._animation_intensity_combo)
-
-        self._animation_spin = QSpinBox()
-        self._animation_spin.setRange(500, 5000)
-        self._animation_spin.setSuffix(" ms")
-        self._animation_spin.setValue(self._temp_settings.animation_duration_ms)
-        layout.addRow("Base animation duration:", self._animation_spin)
 
-        return widget
+        self._animation_spin.setValue(s.animation_duration_ms)
 
     def _create_privacy_tab(self) -> QWidget:
         widget = QWidget()
@@ -333,20 +412,22 @@ class SettingsDialog(QDialog):
             "immediately. You can pause or quit any time."
         )
         notice.setWordWrap(True)
-        notice.setStyleSheet("padding: 12px; background-color: #ecf0f1; border-radius: 8px;")
+        notice.setObjectName("Notice")
         layout.addWidget(notice)
 
         self._privacy_ack_check = QCheckBox("I understand how Blink! uses the camera")
-        self._privacy_ack_check.setChecked(self._temp_settings.privacy_acknowledged)
         layout.addWidget(self._privacy_ack_check)
 
         self._show_privacy_notice_check = QCheckBox("Show privacy reminder on start")
-        self._show_privacy_notice_check.setChecked(self._temp_settings.show_privacy_notice)
         layout.addWidget(self._show_privacy_notice_check)
 
         layout.addStretch()
         return widget
 
+    def _load_privacy_values(self) -> None:
+        self._privacy_ack_check.setChecked(self._temp_settings.privacy_acknowledged)
+        self._show_privacy_notice_check.setChecked(self._temp_settings.show_privacy_notice)
+
     # ---------------- Validation ----------------
     def _accept_settings(self) -> None:
         try: